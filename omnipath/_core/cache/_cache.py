@@ -172,10 +172,12 @@ class NoopCache(MemoryCache):
 
 
 def clear_cache() -> None:
-    """Remove all cached data from :attr:`omnipath.options.cache`."""
+    """Remove all cached data from :attr:`omnipath.options.cache` and the static table listing."""
     from omnipath import options
+    from omnipath._core.utils._static import _static_tables
 
     options.cache.clear()
+    _static_tables.cache_clear()
 
 
 __all__ = [clear_cache]
@@ -81,7 +81,8 @@ class Downloader:
         """
         Fetch the data from the cache, if present, or download them from the ``url``.
 
-        The key, under which is the download result saved, is the MD5 hash of the ``url``, including the ``params``.
+        The key, under which is the download result saved, is the MD5 hash of the ``url``, including the ``params``
+        sorted by their name.
 
         Parameters
         ----------
@@ -117,6 +118,9 @@ class Downloader:
                 )
             ]
 
+        # sort the parameters only here, to get a deterministic URL and cache key
+        if params is not None:
+            params = dict(sorted(params.items()))
         res = None
 
         for the_url in urls:
@@ -205,7 +209,12 @@ class Downloader:
 
 
 def _get_server_version(options: Options) -> str:
-    """Try and get the server version."""
+    """
+    Try and get the server version.
+
+    The version is saved in :attr:`options.cache`, so that it is requested
+    at most once for each cache, instead of every time :mod:`omnipath` is imported.
+    """
     import re
 
     def callback(fp: BytesIO) -> str:
@@ -225,7 +234,6 @@ def _get_server_version(options: Options) -> str:
             options,
             num_retries=0,
             timeout=(1.0, 3.0),
-            cache=None,
             progress_bar=False,
             chunk_size=1024,
         ) as opt:
@@ -233,7 +241,6 @@ def _get_server_version(options: Options) -> str:
                 Endpoint.ABOUT.s,
                 callback,
                 params={Key.FORMAT.s: Format.TEXT.s},
-                cache=False,
             )
     except Exception as e:
         logging.debug(f"Unable to get server version. Reason: `{e}`")
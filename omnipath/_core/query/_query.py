@@ -1,8 +1,7 @@
 from abc import ABCMeta
 from enum import Enum, EnumMeta
 from typing import Set, Tuple, Union, Optional, Sequence, FrozenSet
-
-from inflect import engine
+from functools import lru_cache
 
 from omnipath.constants._constants import FormatterMeta, ErrorFormatter
 from omnipath._core.query._query_validator import (
@@ -13,7 +12,70 @@ from omnipath._core.query._query_validator import (
     InteractionsValidator,
 )
 
-_engine = engine()
+# synonyms of the predefined query parameters, `inflect` takes seconds to import
+# and is only needed for the parameters which are not listed here
+_SYNONYMS = {
+    "aspect": ("aspect", "aspects"),
+    "categories": ("categories", "category"),
+    "causality": ("causalities", "causality"),
+    "databases": ("database", "databases"),
+    "datasets": ("dataset", "datasets"),
+    "directed": ("directed", "directeds"),
+    "dorothea_levels": ("dorothea_level", "dorothea_levels"),
+    "dorothea_methods": ("dorothea_method", "dorothea_methods"),
+    "entity_types": ("entity_type", "entity_types"),
+    "enzyme_substrate": ("enzyme_substrate", "enzyme_substrates"),
+    "enzymes": ("enzyme", "enzymes"),
+    "fields": ("field", "fields"),
+    "format": ("format", "formats"),
+    "genesymbols": ("genesymbol", "genesymbols"),
+    "header": ("header", "headers"),
+    "license": ("license", "licenses"),
+    "limit": ("limit", "limits"),
+    "loops": ("loop", "loops"),
+    "modification": ("modification", "modifications"),
+    "organisms": ("organism", "organisms"),
+    "parent": ("parent", "parents"),
+    "partners": ("partner", "partners"),
+    "password": ("password", "passwords"),
+    "plasma_membrane_peripheral": (
+        "plasma_membrane_peripheral",
+        "plasma_membrane_peripherals",
+    ),
+    "plasma_membrane_transmembrane": (
+        "plasma_membrane_transmembrane",
+        "plasma_membrane_transmembranes",
+    ),
+    "pmp": ("pmp", "pmps"),
+    "pmtm": ("pmtm", "pmtms"),
+    "proteins": ("protein", "proteins"),
+    "rec": ("rec", "recs"),
+    "receiver": ("receiver", "receivers"),
+    "residues": ("residue", "residues"),
+    "resources": ("resource", "resources"),
+    "scope": ("scope", "scopes"),
+    "sec": ("sec", "secs"),
+    "secreted": ("secreted", "secreteds"),
+    "signed": ("signed", "signeds"),
+    "source": ("source", "sources"),
+    "source_target": ("source_target", "source_targets"),
+    "sources": ("source", "sources"),
+    "substrates": ("substrate", "substrates"),
+    "targets": ("target", "targets"),
+    "tfregulons_levels": ("tfregulons_level", "tfregulons_levels"),
+    "tfregulons_methods": ("tfregulons_method", "tfregulons_methods"),
+    "topology": ("topologies", "topology"),
+    "trans": ("tran", "trans"),
+    "transmitter": ("transmitter", "transmitters"),
+    "types": ("type", "types"),
+}
+
+
+@lru_cache(maxsize=1)
+def _engine():
+    from inflect import engine
+
+    return engine()
 
 
 def _get_synonyms(key: str) -> Tuple[str]:
@@ -35,10 +97,13 @@ def _get_synonyms(key: str) -> Tuple[str]:
     if not isinstance(key, str):
         raise TypeError(f"Expected a `str`, found `{type(key)}`.")
 
-    singular = _engine.singular_noun(key)
+    if key in _SYNONYMS:
+        return _SYNONYMS[key]
+
+    singular = _engine().singular_noun(key)
     singular = singular if isinstance(singular, str) else key
 
-    plural = _engine.plural_noun(singular)
+    plural = _engine().plural_noun(singular)
     if not isinstance(plural, str):
         plural = key + "s" if not key.endswith("s") else key
 
@@ -4,6 +4,7 @@ from enum import Enum
 from typing import (
     Any,
     Dict,
+    List,
     Tuple,
     Union,
     Mapping,
@@ -12,8 +13,8 @@ from typing import (
     Optional,
     Sequence,
 )
-from operator import itemgetter
-from functools import wraps, partial
+from functools import wraps, partial, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 from pandas.api.types import is_float_dtype, is_numeric_dtype
@@ -23,6 +24,7 @@ from omnipath import options
 from omnipath.constants import License, Organism
 from omnipath._core.query import QueryType
 from omnipath._core.utils._docs import d
+from omnipath._core.query._query import Query
 from omnipath._core.requests._utils import (
     _ERROR_EMPTY_FMT,
     _inject_params,
@@ -34,23 +36,40 @@ from omnipath._core.requests._utils import (
 from omnipath.constants._pkg_constants import DEFAULT_FIELD, Key, Format, final
 from omnipath._core.downloader._downloader import Downloader
 
+_ERROR_HEADER = b"Something is not entirely good:"
+
 
 def _error_handler(callback: Callable[[BytesIO], Any]) -> Callable:
     @wraps(callback)
-    def wrapper(cls, *args, **kwargs) -> pd.DataFrame:
-        res: pd.DataFrame = callback(*args, **kwargs)
-        if len(res.columns) == 1 and res.columns == ["Something is not entirely good:"]:
-            raise RuntimeError(" ".join(res.iloc[:, 0]))
+    def wrapper(cls, handle: BytesIO, *args, **kwargs) -> pd.DataFrame:
+        # sniff the header before parsing, error responses need not be parsed at all
+        pos = handle.tell()
+        head = handle.read(len(_ERROR_HEADER))
+        handle.seek(pos)
+        if head == _ERROR_HEADER:
+            lines = handle.getvalue().decode("utf-8").splitlines()[1:]
+            raise RuntimeError(" ".join(line.strip() for line in lines if line.strip()))
 
-        return res
+        return callback(handle, *args, **kwargs)
 
     return wrapper
 
 
+@lru_cache(maxsize=None)
+def _get_query(query_type: QueryType, key: str) -> Query:
+    """Return the (cached) query parameter validator for ``key``."""
+    return query_type(key)
+
+
 class OmnipathRequestMeta(ABCMeta):  # noqa: D101
     def __new__(cls, clsname, superclasses, attributedict):  # noqa: D102
         for supercls in superclasses:
-            for attr in ("__string__", "__logical__", "__categorical__"):
+            for attr in (
+                "__string__",
+                "__logical__",
+                "__categorical__",
+                "__filtered__",
+            ):
                 attributedict[attr] = attributedict.get(attr, frozenset()) | getattr(
                     supercls, attr, frozenset()
                 )
@@ -194,7 +213,8 @@ class OmnipathRequestABC(ABC, metaclass=OmnipathRequestMeta):
         res = {}
         for k, v in params.items():
             # first get the validator for the parameter, then validate
-            res[self._query_type(k).param] = self._query_type(k)(v)
+            query = _get_query(self._query_type, k)
+            res[query.param] = query(v)
         return res
 
     def _finalize_params(self, params: Dict[str, Any]) -> Dict[str, str]:
@@ -215,7 +235,7 @@ class OmnipathRequestABC(ABC, metaclass=OmnipathRequestMeta):
             elif v is not None:
                 logging.warning(f"Unable to process parameter `{k}={v}`. Ignoring")
 
-        return dict(sorted(res.items(), key=itemgetter(0)))
+        return res
 
     def _convert_dtypes(self, res: pd.DataFrame, **_) -> pd.DataFrame:
         """Automatically convert dtypes for this type of query."""
@@ -271,16 +291,17 @@ class OmnipathRequestABC(ABC, metaclass=OmnipathRequestMeta):
         tuple
             Unique and sorted resources.
         """
-        return tuple(
-            sorted(
-                res
-                for res, params in self._downloader.resources.items()
-                if self._query_type.endpoint in params.get(Key.QUERIES.s, {})
-                and self._resource_filter(
-                    params[Key.QUERIES.s][self._query_type.endpoint], **kwargs
-                )
-            )
-        )
+        endpoint = self._query_type.endpoint
+        res = []
+        for resource, params in self._downloader.resources.items():
+            queries = params.get(Key.QUERIES.s, {})
+            if endpoint in queries and self._resource_filter(
+                queries[endpoint], **kwargs
+            ):
+                res.append(resource)
+        res.sort()
+
+        return tuple(res)
 
     def _modify_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -442,20 +463,29 @@ class GraphLike(ABC):
             raise ValueError(_ERROR_EMPTY_FMT.format(obj="data"))
 
         source, target = cls._get_source_target_cols(data)
-        G = nx.from_pandas_edgelist(
-            data,
-            source=source,
-            target=target,
-            edge_attr=tuple(data.columns.difference([source, target])),
-            create_using=nx.DiGraph,
+        data = data.copy(deep=False)
+        for col in ("references", "references_stripped", "sources"):
+            if col in data:
+                values = data[col].astype(str)
+                mask = values.str.contains(";", regex=False)
+                if mask.any():
+                    data[col] = (
+                        values.str.split(";")
+                        .apply(sorted)
+                        .where(mask, data[col].astype(object))
+                    )
+
+        G = nx.DiGraph()
+        G.add_edges_from(
+            zip(
+                data[source].to_numpy(),
+                data[target].to_numpy(),
+                data[data.columns.difference([source, target])].to_dict(
+                    orient="records"
+                ),
+            )
         )
 
-        for s, t, attr in G.edges(data=True):
-            for col in ["references", "references_stripped", "sources"]:
-                if col in data:
-                    if ";" in str(attr[col]):
-                        G.edges[s, t][col] = sorted(str(attr[col]).split(";"))
-
         return G
 
 
@@ -542,4 +572,43 @@ class SignedPTMs(Enzsub, GraphLike):
         )
 
 
-__all__ = [Enzsub, SignedPTMs]
+def get_many(
+    queries: Sequence[Union[type, Tuple[type, Optional[Mapping[str, Any]]]]],
+    max_workers: int = 4,
+) -> List[pd.DataFrame]:
+    """
+    Perform multiple requests concurrently.
+
+    The downloads are run in a thread pool, so that the network I/O of one request overlaps
+    with the parsing and post-processing of another one.
+
+    Parameters
+    ----------
+    queries
+        Request classes, such as :class:`omnipath.requests.Enzsub`, or tuples of a request class and
+        the keyword arguments for its ``get`` method.
+    max_workers
+        Maximum number of requests performed at the same time.
+
+    Returns
+    -------
+    list
+        The results of the ``get`` method of each request, in the order of ``queries``.
+    """
+    if max_workers <= 0:
+        raise ValueError(
+            f"Expected `max_workers` to be positive, found `{max_workers}`."
+        )
+
+    jobs = []
+    for query in queries:
+        cls, kwargs = (query, None) if isinstance(query, type) else query
+        jobs.append((cls, {} if kwargs is None else dict(kwargs)))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(cls.get, **kwargs) for cls, kwargs in jobs]
+
+        return [future.result() for future in futures]
+
+
+__all__ = [Enzsub, SignedPTMs, get_many]
@@ -1,3 +1,4 @@
+from abc import ABC
 from types import MethodType
 from typing import *  # noqa: F401 F403 (because of the argspec factory)
 from typing import Any, Dict, Union, Callable, Iterable, Optional
@@ -7,6 +8,7 @@ import inspect
 import wrapt
 import typing_extensions  # noqa: F401
 
+from pandas.api.types import is_string_dtype
 import pandas as pd
 
 from omnipath._core.utils._docs import d
@@ -70,14 +72,17 @@ def _inject_api_method(
             k: v for k, v in clazz._annotations().items() if k not in parameters
         }
 
-        for c in clazz.__mro__:
-            if c.__name__ == "InteractionRequest":
-                parameters["strict_evidences"] = Parameter(
-                    "strict_evidences",
-                    kind=Parameter.KEYWORD_ONLY,
-                    default=None,
-                    annotation=Optional[bool],
-                )
+        from omnipath._core.requests.interactions._interactions import (
+            InteractionRequest,
+        )
+
+        if issubclass(clazz, InteractionRequest):
+            parameters["strict_evidences"] = Parameter(
+                "strict_evidences",
+                kind=Parameter.KEYWORD_ONLY,
+                default=None,
+                annotation=Optional[bool],
+            )
 
         sig = inspect.signature(lambda _: _)
         sig = sig.replace(
@@ -106,7 +111,12 @@ def _inject_api_method(
             f"Expected `clazz` to be a type, found `{type(clazz).__name__}`."
         )
 
-    if isabstract(clazz):
+    # base classes are marked by deriving directly from ABC, even if they have no abstract methods left
+    if (
+        isabstract(clazz)
+        or ABC in clazz.__bases__
+        or getattr(clazz, "_query_type", None) is None
+    ):
         return
 
     @wrapt.decorator(adapter=wrapt.adapter_factory(argspec_factory))
@@ -138,7 +148,7 @@ def _inject_params(
 
 
 def _split_unique_join(data: pd.Series, func: Optional[Callable] = None) -> pd.Series:
-    mask = ~pd.isnull(data.astype("string"))
+    mask = ~pd.isnull(data if is_string_dtype(data) else data.astype("string"))
     data = data[mask]
     data = data.str.split(";")
 
@@ -151,7 +161,7 @@ def _split_unique_join(data: pd.Series, func: Optional[Callable] = None) -> pd.S
     else:
         data = data.apply(func)
 
-    res = pd.Series([None] * len(mask))
+    res = pd.Series([None] * len(mask), index=mask.index)
     res.loc[mask] = data
 
     return res
@@ -184,17 +194,17 @@ def _count_references(df: pd.DataFrame) -> None:
 
 def _count_resources(df: pd.DataFrame) -> None:
     if "sources" in df:
-        df["n_sources"] = df["sources"].astype(str).str.split(";").apply(len)
-        df["n_primary_sources"] = (
-            df["sources"]
-            .astype(str)
-            .str.split(";")
-            .apply(
-                lambda row: len(
-                    [r for r in row if "_" not in r] if isinstance(row, Iterable) else 0
-                )
-            )
-        )
+        sources = df["sources"]
+        # missing values are counted as `'nan'`, same as after `astype(str)`
+        if not is_string_dtype(sources) or sources.isna().any():
+            sources = sources.astype(str)
+        sources = sources.str.split(";").values
+
+        df["n_sources"] = [len(row) for row in sources]
+        df["n_primary_sources"] = [
+            sum("_" not in r for r in row) if isinstance(row, Iterable) else 0
+            for row in sources
+        ]
 
 
 _ERROR_EMPTY_FMT = (
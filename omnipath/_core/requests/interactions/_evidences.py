@@ -1,5 +1,9 @@
-from typing import List, Tuple, Union, Callable, Iterable, Optional
+from typing import Dict, List, Tuple, Union, Iterable, Optional, Sequence
+from operator import itemgetter
 
+import attr
+
+import numpy as np
 import pandas as pd
 
 from omnipath._misc.utils import to_set
@@ -10,6 +14,9 @@ from omnipath._core.requests._utils import (
 )
 
 EVIDENCES_KEYS = ("positive", "negative", "directed", "undirected")
+EVIDENCES_KEYS_FS = frozenset(EVIDENCES_KEYS)
+
+_unnest = itemgetter(*EVIDENCES_KEYS)
 
 
 def _must_have_evidences(df: pd.DataFrame) -> None:
@@ -45,8 +52,10 @@ def unnest_evidences(df: pd.DataFrame, col: str = "evidences") -> pd.DataFrame:
     ValueError
         If the input data frame does not contain "evidences" column.
     """
-    for key in ("positive", "negative", "directed", "undirected"):
-        df[key] = df[col].apply(lambda x: x[key])  # noqa: B023
+    unnested = list(zip(*map(_unnest, df[col].values))) or [()] * len(EVIDENCES_KEYS)
+
+    for key, evs in zip(EVIDENCES_KEYS, unnested):
+        df[key] = pd.Series(evs, index=df.index, dtype=object)
 
     return df
 
@@ -85,24 +94,44 @@ def filter_evidences(
     datasets = to_set(datasets)
     resources = to_set(resources)
 
-    def the_filter(evs):
-        if isinstance(evs, dict):
-            return {k: the_filter(v) for k, v in evs.items()}
-
-        elif isinstance(evs, list):
-            return [
-                ev
-                for ev in evs
-                if (
-                    (not datasets or ev["dataset"] in datasets)
-                    and (not resources or ev["resource"] in resources)
-                )
-            ]
+    if not datasets and not resources:
+        if target_col != col:
+            df[target_col] = df[col]
+
+        return df
 
-        else:
-            return evs
+    records = df[col].tolist()
+    nested = [i for i, evs in enumerate(records) if isinstance(evs, dict)]
+    soa = _to_soa(_unnest(records[i]) for i in nested)
+
+    keep = np.ones(len(soa.evidences), dtype=bool)
+    if datasets:
+        keep &= np.isin(
+            soa.dataset_codes,
+            [soa.dataset_dict[d] for d in datasets if d in soa.dataset_dict],
+        )
+    if resources:
+        keep &= np.isin(
+            soa.resource_codes,
+            [soa.resource_dict[r] for r in resources if r in soa.resource_dict],
+        )
+
+    # the kept evidences of each record and key, delimited by the offsets
+    kept = np.flatnonzero(keep)
+    bounds = np.searchsorted(kept, soa.offsets).tolist()
+    kept = [soa.evidences[e] for e in kept.tolist()]
+    n_keys = len(EVIDENCES_KEYS)
+
+    for i, rec in enumerate(nested):
+        records[rec] = {
+            **records[rec],
+            **{
+                key: kept[bounds[i * n_keys + j] : bounds[i * n_keys + j + 1]]
+                for j, key in enumerate(EVIDENCES_KEYS)
+            },
+        }
 
-    df[target_col] = df[col].apply(the_filter)
+    df[target_col] = pd.Series(records, index=df.index, dtype=object)
 
     return df
 
@@ -128,95 +157,291 @@ def from_evidences(
         on the evidences in `col`. The records with no evidences from the
         specified datasets and resources will be removed.
     """
-    evs_df = pd.DataFrame({"evidences": df[col]})
-    evs_df = unnest_evidences(evs_df)
-    evs_df["ce_positive"] = _curation_effort_from(evs_df, columns="positive")
-    evs_df["ce_negative"] = _curation_effort_from(evs_df, columns="negative")
-    evs_df["ce_directed"] = _curation_effort_from(evs_df, columns="directed")
-
-    df["is_directed"] = evs_df["directed"].apply(bool)
-    df["is_stimulation"] = evs_df["positive"].apply(bool)
-    df["is_inhibition"] = evs_df["negative"].apply(bool)
-    df["curation_effort"] = _curation_effort_from(evs_df)
-    df["sources"] = _resources_from(evs_df)
-    df["references"] = _references_from(evs_df)
-    df["consensus_stimulation"] = evs_df["ce_positive"] >= evs_df["ce_negative"]
-    df["consensus_inhibition"] = evs_df["ce_positive"] <= evs_df["ce_negative"]
+    # drop records which remained without evidences, before compiling anything
+    nonempty = np.fromiter(
+        (any(_unnest(evs)) for evs in df[col].values), dtype=bool, count=len(df)
+    )
+    if not nonempty.all():
+        df = df[nonempty].copy()
+
+    soa = _to_soa(map(_unnest, df[col].values))
+    compiled = _compile_all(soa)
+    n_evs = np.diff(soa.offsets).reshape(-1, len(soa.columns))
+
+    df["is_directed"] = n_evs[:, 2] > 0
+    df["is_stimulation"] = n_evs[:, 0] > 0
+    df["is_inhibition"] = n_evs[:, 1] > 0
+    df["curation_effort"] = compiled["curation_effort"]
+    df["sources"] = pd.Series(compiled["sources"], index=df.index, dtype=object)
+    df["references"] = pd.Series(compiled["references"], index=df.index, dtype=object)
+    df["consensus_stimulation"] = compiled["ce_positive"] >= compiled["ce_negative"]
+    df["consensus_inhibition"] = compiled["ce_positive"] <= compiled["ce_negative"]
 
     # recompile the consensus_direction
-    opposite_direction = pd.DataFrame(
-        {
-            "source": df["source"],
-            "target": df["target"],
-            "ce_directed_opp": evs_df["ce_directed"],
-        }
-    )
-    df["ce_directed"] = evs_df["ce_directed"]
-    df = df.merge(
-        opposite_direction,
-        on=["source", "target"],
-        how="left",
-        sort=False,
+    # index by (target, source), so that looking up (source, target) gives the opposite direction
+    opposite_direction = pd.Series(
+        compiled["ce_directed"],
+        index=pd.MultiIndex.from_arrays([df["target"], df["source"]]),
     )
-    df["consensus_direction"] = (
-        pd.isnull(df["ce_directed_opp"]) | df["ce_directed"] >= df["ce_directed_opp"]
+    if not opposite_direction.index.is_unique:
+        opposite_direction = opposite_direction.groupby(level=[0, 1], sort=False).max()
+    ce_directed = compiled["ce_directed"].astype("float64")
+    ce_directed_opp = opposite_direction.reindex(
+        pd.MultiIndex.from_arrays([df["source"], df["target"]])
+    ).to_numpy(dtype="float64")
+    df["consensus_direction"] = np.isnan(ce_directed_opp) | (
+        ce_directed >= ce_directed_opp
     )
-    df.drop(columns=["ce_directed", "ce_directed_opp"], inplace=True)
 
     _count_resources(df)
     _count_references(df)
     _strip_resource_label_df(df, col="references")
 
-    # drop records which remained without evidences
-    df = df[df.sources.apply(bool)]
-
     return df
 
 
+@attr.s(frozen=True)
+class EvidencesSoA:
+    """
+    Evidences of an interaction data frame in a columnar layout.
+
+    Each evidence is one element of the parallel, flat code arrays. The
+    evidences of record ``i`` in the ``j``-th column are the ones in range
+    ``offsets[i * len(columns) + j]:offsets[i * len(columns) + j + 1]``, the
+    references of evidence ``e`` are ``ref_ids[ref_offsets[e]:ref_offsets[e + 1]]``.
+    Dataset, resource, via and reference names are dictionary encoded, the
+    codes are indices into the corresponding ``*_dict`` keys; evidences
+    without via have ``-1`` via code. The resource and reference codes
+    follow the alphabetic order of the names. ``n_refs`` and ``record_ids`` are the
+    number of references and the index of the record of each evidence,
+    shared by the curation effort and the references. The original evidence dicts are kept
+    in the same order, to reassemble the nested form after filtering.
+    """
+
+    columns: Tuple[str, ...] = attr.ib()
+    n_records: int = attr.ib()
+    offsets: np.ndarray = attr.ib(repr=False)
+    dataset_codes: np.ndarray = attr.ib(repr=False)
+    resource_codes: np.ndarray = attr.ib(repr=False)
+    via_codes: np.ndarray = attr.ib(repr=False)
+    n_refs: np.ndarray = attr.ib(repr=False)
+    ref_offsets: np.ndarray = attr.ib(repr=False)
+    ref_ids: np.ndarray = attr.ib(repr=False)
+    dataset_dict: Dict[str, int] = attr.ib(repr=False)
+    resource_dict: Dict[str, int] = attr.ib(repr=False)
+    via_dict: Dict[str, int] = attr.ib(repr=False)
+    ref_dict: Dict[str, int] = attr.ib(repr=False)
+    record_ids: np.ndarray = attr.ib(repr=False)
+    evidences: List[dict] = attr.ib(repr=False)
+
+    @property
+    def record_offsets(self) -> np.ndarray:
+        """Offsets delimiting the evidences of each record."""
+        return self.offsets[:: len(self.columns)]
+
+
+def _to_soa(
+    records: Iterable[Sequence[List[dict]]],
+    columns: Iterable[str] = EVIDENCES_KEYS,
+) -> EvidencesSoA:
+    """Convert the evidence lists of each record to a :class:`EvidencesSoA`."""
+    columns = tuple(columns)
+    n_records = 0
+    dataset_dict, resource_dict, via_dict, ref_dict = {}, {}, {}, {}
+    datasets, resources, vias, ref_ids, n_refs, sizes = [], [], [], [], [], []
+    evidences = []
+
+    for rec in records:
+        n_records += 1
+        for evs in rec:
+            sizes.append(len(evs))
+            evidences.extend(evs)
+            for ev in evs:
+                via, refs = ev["via"], ev["references"]
+                datasets.append(
+                    dataset_dict.setdefault(ev["dataset"], len(dataset_dict))
+                )
+                resources.append(
+                    resource_dict.setdefault(ev["resource"], len(resource_dict))
+                )
+                vias.append(via_dict.setdefault(via, len(via_dict)) if via else -1)
+                n_refs.append(len(refs))
+                ref_ids.extend(ref_dict.setdefault(ref, len(ref_dict)) for ref in refs)
+
+    def to_offsets(counts: np.ndarray) -> np.ndarray:
+        return np.concatenate([[0], np.cumsum(counts, dtype=np.int64)])
+
+    def sort_codes(
+        mapping: Dict[str, int], codes: List[int]
+    ) -> Tuple[Dict[str, int], np.ndarray]:
+        # re-code so that the order of the codes follows the order of the names
+        names = sorted(mapping)
+        rank = np.empty(len(names), dtype=np.int32)
+        rank[[mapping[name] for name in names]] = np.arange(len(names))
+
+        return {name: i for i, name in enumerate(names)}, rank[
+            np.asarray(codes, dtype=np.int64)
+        ]
+
+    resource_dict, resources = sort_codes(resource_dict, resources)
+    ref_dict, ref_ids = sort_codes(ref_dict, ref_ids)
+    n_refs = np.asarray(n_refs, dtype=np.int64)
+    offsets = to_offsets(sizes)
+    record_offsets = offsets[:: len(columns)]
+
+    return EvidencesSoA(
+        columns=columns,
+        n_records=n_records,
+        offsets=offsets,
+        dataset_codes=np.asarray(datasets, dtype=np.int32),
+        resource_codes=resources,
+        via_codes=np.asarray(vias, dtype=np.int32),
+        n_refs=n_refs,
+        ref_offsets=to_offsets(n_refs),
+        ref_ids=ref_ids,
+        dataset_dict=dataset_dict,
+        resource_dict=resource_dict,
+        via_dict=via_dict,
+        ref_dict=ref_dict,
+        record_ids=np.repeat(
+            np.arange(n_records, dtype=np.int64), np.diff(record_offsets)
+        ),
+        evidences=evidences,
+    )
+
+
+def _segment_sum(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Sum ``values`` within the (possibly empty) segments delimited by ``offsets``."""
+    cumsum = np.concatenate([[0], np.cumsum(values, dtype=np.int64)])
+
+    return cumsum[offsets[1:]] - cumsum[offsets[:-1]]
+
+
+def _join_by_record(
+    record_ids: np.ndarray,
+    codes: np.ndarray,
+    labels: List[str],
+    n_records: int,
+    presorted: bool = False,
+) -> List[str]:
+    """
+    Join the distinct labels of each record, in alphabetic order, by semicolons.
+
+    If ``presorted``, the labels are distinct and sorted already, hence the
+    codes are order preserving and the labels are not sorted again.
+    """
+    if presorted:
+        names = np.asarray(labels, dtype=object)
+        name_ids = np.arange(len(names), dtype=np.int64)
+    else:
+        names, name_ids = np.unique(
+            np.asarray(labels, dtype=object), return_inverse=True
+        )
+
+    n_names = max(len(names), 1)
+    pairs = np.unique(record_ids * n_names + name_ids[codes])
+    # plain lists: slicing and joining those is much cheaper than object arrays
+    bounds = np.searchsorted(pairs // n_names, np.arange(n_records + 1)).tolist()
+    names = names[pairs % n_names].tolist()
+
+    return [";".join(names[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def _soa_resources(soa: EvidencesSoA) -> List[str]:
+    """Resources of each record, labelled by the resources they are obtained via."""
+    resources, vias = list(soa.resource_dict), list(soa.via_dict)
+    n_vias = len(vias) + 1
+    keys, codes = np.unique(
+        soa.resource_codes.astype(np.int64) * n_vias + soa.via_codes + 1,
+        return_inverse=True,
+    )
+    labels = [
+        resources[key // n_vias]
+        + (f"_{vias[key % n_vias - 1]}" if key % n_vias else "")
+        for key in keys.tolist()
+    ]
+
+    # without any via, the labels are the resource names in code order
+    return _join_by_record(
+        soa.record_ids, codes, labels, soa.n_records, presorted=not vias
+    )
+
+
+def _soa_references(soa: EvidencesSoA, prefix: bool = True) -> List[str]:
+    """References of each record, optionally prefixed by the resource."""
+    record_ids = np.repeat(soa.record_ids, soa.n_refs)
+    refs = list(soa.ref_dict)
+
+    if not prefix:
+        return _join_by_record(
+            record_ids, soa.ref_ids, refs, soa.n_records, presorted=True
+        )
+
+    resources = list(soa.resource_dict)
+    n_refs = max(len(refs), 1)
+    keys, codes = np.unique(
+        np.repeat(soa.resource_codes.astype(np.int64), soa.n_refs) * n_refs
+        + soa.ref_ids,
+        return_inverse=True,
+    )
+    labels = [
+        f"{resources[key // n_refs]}:{refs[key % n_refs]}" for key in keys.tolist()
+    ]
+
+    return _join_by_record(record_ids, codes, labels, soa.n_records)
+
+
+def _compile_all(soa: EvidencesSoA) -> Dict[str, Union[np.ndarray, List[str]]]:
+    """
+    Compile all columns derived from the evidences.
+
+    The curation effort by direction and effect sign, the resources and the
+    references are all derived from the same columnar layout.
+
+    Returns
+    -------
+        A dict with keys "ce_positive", "ce_negative", "ce_directed",
+        "curation_effort", "sources" and "references".
+    """
+    efforts = _segment_sum(soa.n_refs + 1, soa.offsets).reshape(-1, len(soa.columns))
+
+    return {
+        "ce_positive": efforts[:, 0],
+        "ce_negative": efforts[:, 1],
+        "ce_directed": efforts[:, 2],
+        "curation_effort": efforts.sum(axis=1),
+        "sources": _soa_resources(soa),
+        "references": _soa_references(soa),
+    }
+
+
 def _ensure_unnested(
     df: pd.DataFrame,
     columns: Union[str, Iterable[str]] = EVIDENCES_KEYS,
-) -> Tuple[pd.DataFrame, Tuple[str]]:
+) -> Tuple[Iterable[Tuple[List[dict], ...]], Tuple[str, ...]]:
     """
-    Unnest a nested evidences column in a single column data frame.
+    Iterate the evidence lists of each record, unnesting them if necessary.
 
     Used only in some specific contexts within this module, all are helper
     functions of `from_evidences`.
 
     Returns
     -------
-        A tuple of the input data frame and a tuple of column names. If the
-        data frame does not consist of a single nested evidences columns it
-        will be still subsetted to the specified columns.
+        A tuple of an iterable of the evidence lists of each record, and a
+        tuple of column names. If `columns` is a single nested evidences
+        column, the evidence lists are taken from the nested dicts without
+        creating the unnested columns.
     """
-    columns = list(to_set(columns))
-    evs_df = df[columns]
-
-    if (
-        evs_df.shape[1] == 1
-        and isinstance(evs_df.iloc[0, 0], dict)
-        and not set(EVIDENCES_KEYS) - set(evs_df.iloc[0, 0].keys())
-    ):
-        evs_df = unnest_evidences(evs_df, col=evs_df.columns[0])
-        columns = EVIDENCES_KEYS
-
-    evs_df = evs_df[columns]
+    columns = tuple(to_set(columns))
 
-    return evs_df, columns
+    if len(columns) == 1:
+        values = df[columns[0]].values
+        first = values[0] if len(values) else None
 
+        if isinstance(first, dict) and EVIDENCES_KEYS_FS.issubset(first.keys()):
+            return map(_unnest, values), EVIDENCES_KEYS
 
-def _from(
-    df: pd.DataFrame,
-    func: Callable,
-    columns: Union[str, Iterable[str]] = EVIDENCES_KEYS,
-) -> List[Union[int, str]]:
-    """Compile a new column by applying a function on evidences."""
-    evs_df, columns = _ensure_unnested(df, columns)
-
-    return [
-        func(ev for evs in rec for ev in evs)
-        for rec in evs_df[columns].itertuples(index=False)
-    ]
+    return zip(*(df[col].values for col in columns)), columns
 
 
 def _curation_effort_from(
@@ -224,11 +449,9 @@ def _curation_effort_from(
     columns: Union[str, Iterable[str]] = EVIDENCES_KEYS,
 ) -> List[int]:
     """Curation effort from one or more evidences columns."""
-    return _from(
-        df=df,
-        func=lambda evs: sum(len(ev["references"]) + 1 for ev in evs),
-        columns=columns,
-    )
+    soa = _to_soa(*_ensure_unnested(df, columns))
+
+    return _segment_sum(soa.n_refs + 1, soa.record_offsets).tolist()
 
 
 def _resources_from(
@@ -236,18 +459,7 @@ def _resources_from(
     columns: Union[str, Iterable[str]] = EVIDENCES_KEYS,
 ) -> List[str]:
     """Resources from one or more evidences columns."""
-
-    def extract_resources(evs: tuple) -> str:
-        return ";".join(
-            sorted(
-                {
-                    f"{ev['resource']}{'_' if ev['via'] else ''}{ev['via'] or ''}"
-                    for ev in evs
-                }
-            )
-        )
-
-    return _from(df=df, func=extract_resources, columns=columns)
+    return _soa_resources(_to_soa(*_ensure_unnested(df, columns)))
 
 
 def _references_from(
@@ -256,19 +468,7 @@ def _references_from(
     prefix: bool = True,
 ) -> List[str]:
     """Get references from one or more evidences columns."""
-
-    def extract_references(evs: tuple) -> str:
-        return ";".join(
-            sorted(
-                {
-                    f"{ev['resource'] + ':' if prefix else ''}{ref}"
-                    for ev in evs
-                    for ref in ev["references"]
-                }
-            )
-        )
-
-    return _from(df=df, func=extract_references, columns=columns)
+    return _soa_references(_to_soa(*_ensure_unnested(df, columns)), prefix=prefix)
 
 
 def only_from(
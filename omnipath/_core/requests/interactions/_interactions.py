@@ -1,5 +1,17 @@
-from abc import ABC, abstractmethod
-from typing import Any, Set, Dict, Tuple, Union, Mapping, Iterable, Optional, Sequence
+from abc import ABC
+from typing import (
+    Any,
+    Set,
+    Dict,
+    Tuple,
+    Union,
+    Mapping,
+    Iterable,
+    Optional,
+    Sequence,
+    FrozenSet,
+)
+from functools import lru_cache
 import logging
 
 import pandas as pd
@@ -14,6 +26,12 @@ from omnipath._core.requests.interactions._json import _json_cols_hook
 from omnipath._core.requests.interactions._evidences import only_from
 
 Datasets_t = Union[str, InteractionDataset, Sequence[str], Sequence[InteractionDataset]]
+_ALL_DATASETS = frozenset(InteractionDataset)
+
+
+@lru_cache(maxsize=None)
+def _to_dataset(value: Union[str, InteractionDataset]) -> InteractionDataset:
+    return InteractionDataset(value)
 
 
 def _to_dataset_set(
@@ -24,12 +42,28 @@ def _to_dataset_set(
     elif datasets is None:
         datasets = none_value
 
-    if not isinstance(datasets, Iterable):
+    # cheaper than an `isinstance` check against the `Iterable` ABC
+    try:
+        datasets = iter(datasets)
+    except TypeError:
         raise TypeError(
             f"Expected `{name}` to be an `Iterable`, found `{type(datasets).__name__}`."
-        )
+        ) from None
+
+    return {_to_dataset(d) for d in datasets}
+
 
-    return {InteractionDataset(d) for d in datasets}
+@lru_cache(maxsize=None)
+def _filtered_params(query_type: QueryType, keys: FrozenSet[str]) -> Tuple[str, ...]:
+    params = []
+    for key in keys:
+        try:
+            params.append(query_type(key).param)
+        except ValueError:
+            # not a valid key anymore, nothing to remove
+            pass
+
+    return tuple(params)
 
 
 @d.dedent
@@ -60,6 +94,8 @@ class InteractionRequest(CommonPostProcessor, GraphLike, ABC):
             "consensus_inhibition",
         }
     )
+    # keys of the query parameters not applicable to the requested datasets
+    __filtered__ = frozenset({Key.DATASETS.s})
 
     _query_type = QueryType.INTERACTIONS
 
@@ -79,7 +115,7 @@ class InteractionRequest(CommonPostProcessor, GraphLike, ABC):
                 f"After excluding `{len(exclude)}` datasets, none were left."
             )
 
-        self._datasets = datasets
+        self._datasets = frozenset(datasets)
 
     def _modify_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
         params = super()._modify_params(params)
@@ -87,9 +123,9 @@ class InteractionRequest(CommonPostProcessor, GraphLike, ABC):
         return params
 
     @classmethod
-    @abstractmethod
     def _filter_params(cls, params: Dict[str, Any]) -> Dict[str, Any]:
-        params.pop(cls._query_type(Key.DATASETS.s).param, None)
+        for param in _filtered_params(cls._query_type, cls.__filtered__):
+            params.pop(param, None)
 
         return params
 
@@ -115,12 +151,12 @@ class InteractionRequest(CommonPostProcessor, GraphLike, ABC):
         data: Mapping[str, Any],
         datasets: Optional[Sequence[InteractionDataset]] = None,
     ) -> bool:
-        res = datasets is None or (
-            {InteractionDataset(d) for d in data.get(Key.DATASETS.s, {})}
-            & {InteractionDataset(d) for d in datasets}
-        )
+        if datasets is None:
+            return True
+        if not isinstance(datasets, frozenset):
+            datasets = frozenset(map(_to_dataset, datasets))
 
-        return res
+        return any(_to_dataset(d) in datasets for d in data.get(Key.DATASETS.s, ()))
 
     def _post_process(self, df: pd.DataFrame) -> pd.DataFrame:
         df = super()._post_process(df)
@@ -149,23 +185,14 @@ class InteractionRequest(CommonPostProcessor, GraphLike, ABC):
 class CommonParamFilter(InteractionRequest, ABC):
     """Filter which tries to remove some common invalid parameters from many interaction queries."""
 
-    @classmethod
-    def _filter_params(cls, params: Dict[str, Any]) -> Dict[str, Any]:
-        params = super()._filter_params(params)
-
-        for key in (
+    __filtered__ = frozenset(
+        {
             "dorothea_levels",
             "dorothea_methods",
             "tfregulons_levels",
             "tfregulons_methods",
-        ):
-            try:
-                # catch the ValueError if not a valid key anymore
-                params.pop(cls._query_type(key).param)
-            except (KeyError, ValueError):
-                pass
-
-        return params
+        }
+    )
 
 
 @final
@@ -219,19 +246,13 @@ class Dorothea(InteractionRequest):
     (TF)-target interactions from `DoRothEA <https://github.com/saezlab/DoRothEA>`__.
     """
 
+    __filtered__ = frozenset({"tfregulons_levels", "tfregulons_methods"})
+
     _strict_evidences = True
 
     def __init__(self):
         super().__init__(InteractionDataset.DOROTHEA)
 
-    @classmethod
-    def _filter_params(cls, params: Dict[str, Any]) -> Dict[str, Any]:
-        params = super()._filter_params(params)
-        params.pop(cls._query_type("tfregulons_levels").param, None)
-        params.pop(cls._query_type("tfregulons_methods").param, None)
-
-        return params
-
 
 @final
 class CollecTRI(InteractionRequest):
@@ -249,12 +270,6 @@ class CollecTRI(InteractionRequest):
     def __init__(self):
         super().__init__(InteractionDataset.COLLECTRI)
 
-    @classmethod
-    def _filter_params(cls, params: Dict[str, Any]) -> Dict[str, Any]:
-        params = super()._filter_params(params)
-
-        return params
-
 
 @final
 class TFtarget(InteractionRequest):
@@ -268,17 +283,11 @@ class TFtarget(InteractionRequest):
     :class:`omnipath.interactions.TFmiRNA` which provides TF-miRNA gene interactions.
     """
 
+    __filtered__ = frozenset({"dorothea_levels", "dorothea_methods"})
+
     def __init__(self):
         super().__init__(InteractionDataset.TF_TARGET)
 
-    @classmethod
-    def _filter_params(cls, params: Dict[str, Any]) -> Dict[str, Any]:
-        params = super()._filter_params(params)
-        params.pop(cls._query_type("dorothea_levels").param, None)
-        params.pop(cls._query_type("dorothea_methods").param, None)
-
-        return params
-
 
 @final
 class Transcriptional(InteractionRequest):
@@ -356,7 +365,6 @@ class SmallMolecule(CommonParamFilter):
         super().__init__(InteractionDataset.SMALL_MOLECULE)
 
 
-
 @final
 class OmniPath(InteractionRequest):
     """
@@ -421,6 +429,17 @@ class AllInteractions(InteractionRequest):
     def _filter_params(cls, params: Dict[str, Any]) -> Dict[str, Any]:
         return super()._filter_params(params)
 
+    def _resource_filter(
+        self,
+        data: Mapping[str, Any],
+        datasets: Optional[Sequence[InteractionDataset]] = None,
+    ) -> bool:
+        # with every dataset included, any resource with a dataset is kept
+        if datasets == _ALL_DATASETS:
+            return bool(data.get(Key.DATASETS.s))
+
+        return super()._resource_filter(data, datasets=datasets)
+
     @classmethod
     @d.dedent
     def get(
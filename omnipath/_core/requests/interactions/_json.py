@@ -1,12 +1,19 @@
-import json
-
 import pandas as pd
 
+try:
+    # optional, C-accelerated JSON decoder
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 
 def convert_json_col(df: pd.DataFrame, col: str) -> pd.DataFrame:
     """
     Convert a column of JSON encoded strings to nested Python objects.
 
+    If :mod:`orjson` is installed, it is used for decoding, otherwise the
+    standard library's :mod:`json`.
+
     Parameters
     ----------
     df
@@ -22,7 +29,7 @@ def convert_json_col(df: pd.DataFrame, col: str) -> pd.DataFrame:
         data frame is returned unmodified.
     """
     if col in df.columns:
-        df[col] = df[col].apply(json.loads)
+        df[col] = [loads(value) for value in df[col].to_numpy()]
 
     return df
 
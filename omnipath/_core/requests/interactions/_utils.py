@@ -1,13 +1,19 @@
-from typing import Any, Dict, Mapping, Optional
+from enum import Enum
+from typing import Any, Dict, Mapping, Iterable, Optional
+from hashlib import md5
+import logging
 
+import numpy as np
 import pandas as pd
 
+from omnipath import options
 from omnipath.constants._constants import InteractionDataset
 from omnipath._core.requests._utils import _ERROR_EMPTY_FMT
 from omnipath._core.requests._intercell import Intercell
 from omnipath._core.requests.interactions._interactions import (
     Datasets_t,
     AllInteractions,
+    _to_dataset_set,
 )
 
 
@@ -15,35 +21,115 @@ def _to_dict(mapping: Optional[Mapping[Any, Any]]) -> Dict[Any, Any]:
     return {} if mapping is None else dict(mapping)
 
 
+def _shared_intercell_params(
+    transmitter_params: Dict[str, Any], receiver_params: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Return the parameters of a single query serving both sides, if they only differ in the causality."""
+    if (
+        transmitter_params.get("causality") != "trans"
+        or receiver_params.get("causality") != "rec"
+    ):
+        return None
+
+    shared = {k: v for k, v in transmitter_params.items() if k != "causality"}
+    if shared != {k: v for k, v in receiver_params.items() if k != "causality"}:
+        return None
+
+    return shared
+
+
+def _with_role(df: pd.DataFrame, role: str) -> pd.DataFrame:
+    if role not in df.columns:
+        return df.iloc[:0]
+
+    return df.loc[df[role].eq(True).to_numpy()]
+
+
+def _normalize(value: Any) -> Any:
+    """Convert ``value`` to nested tuples with a deterministic representation."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(k), _normalize(v)) for k, v in value.items()))
+    if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+        return value
+
+    values = tuple(_normalize(v) for v in value)
+
+    return (
+        tuple(sorted(values, key=repr))
+        if isinstance(value, (set, frozenset))
+        else values
+    )
+
+
+_INTRACELL = ("intracellular_intercellular_related", "intracellular")
+
+
+def _not_intracell(df: pd.DataFrame) -> np.ndarray:
+    parent = df["parent"]
+    if isinstance(parent.dtype, pd.CategoricalDtype):
+        # compare only the categories, missing values (code `-1`) select the appended `True`
+        keep = np.append(~parent.cat.categories.isin(_INTRACELL), True)
+        return keep[parent.cat.codes.to_numpy()]
+
+    return ~parent.isin(_INTRACELL).to_numpy()
+
+
 def _swap_undirected(df: pd.DataFrame) -> pd.DataFrame:
     if "is_directed" not in df.columns:
         raise KeyError(f"Key `'is_directed'` not found in `{list(df.columns)}`.")
 
-    directed = df.pop("is_directed")
+    # select rows by position and drop `is_directed` at once, without modifying `df`
+    directed = df["is_directed"].to_numpy(dtype=bool)
+    columns = np.flatnonzero(df.columns != "is_directed")
 
-    undirected = df.loc[~directed, :]
+    undirected = df.iloc[np.flatnonzero(~directed), columns]
     if undirected.empty:
-        return df
+        return df.iloc[:, columns]
 
-    undirected_swapped = undirected.copy()
-    undirected_swapped[["source", "target"]] = undirected[["target", "source"]]
-
-    if "source_genesymbol" in undirected:
-        undirected_swapped[["source_genesymbol", "target_genesymbol"]] = undirected[
-            ["target_genesymbol", "source_genesymbol"]
-        ]
-    if "ncbi_tax_id_source" in undirected.columns:
-        undirected_swapped[["ncbi_tax_id_source", "ncbi_tax_id_target"]] = undirected[
-            ["ncbi_tax_id_target", "ncbi_tax_id_source"]
-        ]
+    # swap by renaming the columns, `concat` aligns them by name
+    swap = {}
+    for source, target in (
+        ("source", "target"),
+        ("source_genesymbol", "target_genesymbol"),
+        ("ncbi_tax_id_source", "ncbi_tax_id_target"),
+    ):
+        if source in undirected.columns:
+            swap.update({source: target, target: source})
 
     return pd.concat(
-        [directed, undirected, undirected_swapped],
+        [
+            df.iloc[np.flatnonzero(directed), columns],
+            undirected,
+            undirected.rename(columns=swap, copy=False),
+        ],
         axis=0,
         ignore_index=True,
     )
 
 
+def _aggregate_intercell(df: pd.DataFrame) -> pd.DataFrame:
+    """Keep the first annotation of each protein and category, joining the databases."""
+    # category and parent are categories, only the observed combinations are needed
+    gb = df.groupby(
+        ["uniprot", "category", "parent"],
+        as_index=False,
+        sort=False,
+        dropna=False,
+        observed=True,
+    )
+
+    def join(databases: pd.Series) -> str:
+        # missing databases are skipped, they cannot be joined
+        return ";".join(databases.dropna().astype(str))
+
+    database = gb["database"].agg(join)["database"]
+
+    # groups are in order of appearance, same as the first rows
+    return gb.nth(0).assign(database=database.values)
+
+
 def import_intercell_network(
     include: Datasets_t = (
         InteractionDataset.OMNIPATH,
@@ -82,12 +168,14 @@ def import_intercell_network(
     receiver_params
         Parameters defining the receiver side of intercellular connections.
         See :meth:`omnipath.interactions.AllInteractions.params` for available values.
+        If both sides only differ in their causality, they are retrieved in a single query.
 
     Returns
     -------
     :class:`pandas.DataFrame`
         A dataframe containing information about protein-protein interactions and the inter-cellular roles
-        of the proteins involved in those interactions.
+        of the proteins involved in those interactions. The result is saved in :attr:`omnipath.options.cache`,
+        and repeated calls with the same parameters return it from there.
     """
     interactions_params = _to_dict(interactions_params)
     transmitter_params = _to_dict(transmitter_params)
@@ -99,39 +187,80 @@ def import_intercell_network(
     receiver_params.setdefault("causality", "rec")
     receiver_params.setdefault("scope", "generic")
 
-    interactions = AllInteractions.get(include=include, **interactions_params)
+    from omnipath import __version__
+
+    # the package version is part of the key, as the processing may change
+    key = md5(
+        repr(
+            _normalize(
+                (
+                    "import_intercell_network",
+                    __version__,
+                    options.url,
+                    options.fallback_urls,
+                    # added to each request, the key itself is a digest
+                    options.license,
+                    options.password,
+                    _to_dataset_set(include, "include", set(InteractionDataset)),
+                    interactions_params,
+                    transmitter_params,
+                    receiver_params,
+                )
+            )
+        ).encode("utf-8")
+    ).hexdigest()
+    if key in options.cache:
+        logging.debug(f"Found intercell network in cache `{options.cache}[{key!r}]`")
+        return options.cache[key]
+
+    from omnipath._core.requests._request import get_many
+
+    shared = _shared_intercell_params(transmitter_params, receiver_params)
+    # the queries are independent, download them concurrently
+    interactions, *intercell = get_many(
+        [(AllInteractions, {"include": include, **interactions_params})]
+        + (
+            [(Intercell, transmitter_params), (Intercell, receiver_params)]
+            if shared is None
+            else [(Intercell, shared)]
+        )
+    )
+
     if interactions.empty:
         raise ValueError(_ERROR_EMPTY_FMT.format(obj="interactions"))
     interactions = _swap_undirected(interactions)
 
-    transmitters = Intercell.get(**transmitter_params)
+    if shared is None:
+        transmitters, receivers = intercell
+    else:
+        # split both sides by the roles the server would filter on
+        transmitters = _with_role(intercell[0], "transmitter")
+        receivers = _with_role(intercell[0], "receiver")
     if transmitters.empty:
         raise ValueError(_ERROR_EMPTY_FMT.format(obj="transmitters"))
-    receivers = Intercell.get(**receiver_params)
     if receivers.empty:
         raise ValueError(_ERROR_EMPTY_FMT.format(obj="receivers"))
 
     # fmt: off
-    intracell = ['intracellular_intercellular_related', 'intracellular']
-    transmitters = transmitters.loc[~transmitters["parent"].isin(intracell), :].copy()
+    transmitters = transmitters.loc[_not_intracell(transmitters), :].copy()
     transmitters.rename(columns={"source": "category_source"}, inplace=True)
-    # this makes it 3x as fast during groupby, since all of these are categories
-    # it's mostly because groupby needs observed=True + using string object (numpy) vs "string"
-    transmitters[["category", "parent", "database"]] = transmitters[["category", "parent", "database"]].astype(str)
 
-    receivers = receivers.loc[~receivers["parent"].isin(intracell), :].copy()
+    receivers = receivers.loc[_not_intracell(receivers), :].copy()
     receivers.rename(columns={"source": "category_source"}, inplace=True)
-    receivers[["category", "parent", "database"]] = receivers[["category", "parent", "database"]].astype(str)
 
+    # aggregate the annotations before merging, the merges then yield the final records
+    transmitters = _aggregate_intercell(transmitters)
+    receivers = _aggregate_intercell(receivers)
+
+    # semi-joins keep the order of the merges, but make them (and the deduplication) smaller
+    interactions = interactions.loc[interactions["source"].isin(transmitters["uniprot"]), :]
     res = pd.merge(interactions, transmitters, left_on="source", right_on="uniprot", how="inner")
     if res.empty:
         raise ValueError("No values are left after merging interactions and transmitters.")
-    gb = res.groupby(["category", "parent", "source", "target"], as_index=False)
+    res = res.loc[res["target"].isin(receivers["uniprot"]), :]
+    res.drop_duplicates(["category", "parent", "source", "target"], inplace=True)
     # fmt: on
 
-    res = gb.nth(0).copy()  # much faster than 1st
-    res["database"] = gb["database"].apply(";".join)["database"].astype(str)
-
     res = pd.merge(
         res,
         receivers,
@@ -142,7 +271,7 @@ def import_intercell_network(
     )
     if res.empty:
         raise ValueError("No values are left after merging interactions and receivers.")
-    gb = res.groupby(
+    res.drop_duplicates(
         [
             "category_intercell_source",
             "parent_intercell_source",
@@ -151,19 +280,10 @@ def import_intercell_network(
             "category_intercell_target",
             "parent_intercell_target",
         ],
-        as_index=False,
-    )
-
-    res = gb.nth(0).copy()
-    res["database_intercell_target"] = (
-        gb["database_intercell_target"]
-        .apply(";".join)["database_intercell_target"]
-        .astype(str)
+        inplace=True,
     )
 
-    # retype back as categories
-    for col in ["category", "parent"]:
-        for suffix in ["_intercell_source", "_intercell_target"]:
-            res[f"{col}{suffix}"] = res[f"{col}{suffix}"].astype("category")
+    res = res.reset_index(drop=True)
+    options.cache[key] = res
 
-    return res.reset_index(drop=True)
+    return res
@@ -1,3 +1,5 @@
+from functools import partial, lru_cache
+
 import pandas as pd
 
 from omnipath._core.downloader._downloader import Downloader
@@ -12,14 +14,22 @@ HOMOLOGENE_URL = (
 )
 
 
+@lru_cache(maxsize=1)
 def _get_homologene_raw():
+    # parsed once per process, the result is shared and must not be modified
     dwnld = Downloader()
     homologene = (
         dwnld.maybe_download(
             HOMOLOGENE_URL,
-            callback=pd.read_table,
+            # read the ids as strings directly, instead of inferring numbers first
+            callback=partial(
+                pd.read_table,
+                usecols=["HID", "Gene.ID", "Gene.Symbol", "Taxonomy"],
+                dtype=str,
+            ),
             is_final=True,
         )
+        # also covers previously cached tables, missing values become "nan" as before
         .astype(str)
         .rename(
             columns={
@@ -29,11 +39,19 @@ def _get_homologene_raw():
                 "HID": "hid",
             }
         )
+        # only a few taxa, the ids stay strings as they are returned to the user
+        .astype({"ncbi_taxid": "category"})
         .set_index("hid")
     )
     return homologene
 
 
+@lru_cache(maxsize=1)
+def _get_homologene_by_taxon():
+    homologene = _get_homologene_raw()
+    return dict(tuple(homologene.groupby("ncbi_taxid", sort=False, observed=True)))
+
+
 def show_homologene():
     """Show the homologene taxa data"""
     dwnld = Downloader()
@@ -63,20 +81,20 @@ def download_homologene(source_organism, target_organism, id_type="genesymbol"):
     A pandas DataFrame with homologene information.
 
     """
-    homologene = _get_homologene_raw()
+    by_taxon = _get_homologene_by_taxon()
+    # unknown taxa yield no homologs
+    empty = _get_homologene_raw().iloc[:0]
     s_taxid = str(source_organism)
     t_taxid = str(target_organism)
 
-    source_df = homologene[(homologene["ncbi_taxid"] == s_taxid)][[id_type]]
-    target_df = homologene[(homologene["ncbi_taxid"] == t_taxid)][[id_type]]
+    source_df = by_taxon.get(s_taxid, empty)[[id_type]]
+    # not an identity map, a HomoloGene group can hold several genes of one taxon
+    target_df = (
+        source_df if t_taxid == s_taxid else by_taxon.get(t_taxid, empty)[[id_type]]
+    )
 
-    homologene = pd.merge(
-        source_df,
-        target_df,
-        right_index=True,
-        left_index=True,
-        suffixes=("_source", "_target"),
-        how="inner",
+    homologene = source_df.join(
+        target_df, how="inner", lsuffix="_source", rsuffix="_target"
     )
     homologene = homologene.reset_index().rename(
         {f"{id_type}_source": "source", f"{id_type}_target": "target"}, axis=1
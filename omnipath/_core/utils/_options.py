@@ -1,5 +1,6 @@
 from typing import Any, Tuple, Union, ClassVar, NoReturn, Optional
 from pathlib import Path
+from functools import lru_cache
 from urllib.parse import urlparse
 import configparser
 
@@ -28,11 +29,16 @@ def _is_non_negative(_instance, attribute: attr.Attribute, value: int) -> NoRetu
         )
 
 
-def _is_valid_url(_instance, _attribute: attr.Attribute, value: str) -> NoReturn:
-    """Check whether the ``value`` forms a valid URL."""
+@lru_cache(maxsize=64)
+def _has_scheme_and_netloc(value: str) -> bool:
     pr = urlparse(value)
 
-    if not pr.scheme or not pr.netloc:
+    return bool(pr.scheme and pr.netloc)
+
+
+def _is_valid_url(_instance, _attribute: attr.Attribute, value: str) -> NoReturn:
+    """Check whether the ``value`` forms a valid URL."""
+    if not _has_scheme_and_netloc(value):
         raise ValueError(f"Invalid URL: `{value}`.")
 
 
@@ -1,6 +1,6 @@
-from itertools import product
+from types import MappingProxyType
+from functools import lru_cache
 
-import numpy as np
 import pandas as pd
 
 from omnipath._core.utils._homologene import download_homologene
@@ -8,56 +8,75 @@ from omnipath._core.utils._homologene import download_homologene
 CPLEX_PREFIX = "COMPLEX:"
 
 
-# Replace list elements with dictionary values
-def _replace_subunits(lst, my_dict, one_to_many):
-    result = []
-    for x in lst:
-        if x in my_dict:
-            value = my_dict[x]
+@lru_cache(maxsize=32)
+def _get_map_dict(source_organism, target_organism, id_type):
+    map_df = download_homologene(source_organism, target_organism, id_type).set_index(
+        "source"
+    )
+    # shared between the calls, hence read-only
+    return MappingProxyType(map_df.groupby(level=0)["target"].apply(list).to_dict())
 
-            if not isinstance(value, list):
-                value = [value]
 
-            if len(value) > one_to_many:
-                result.append(np.nan)
-            else:
-                result.append(value)
-        else:
-            result.append(np.nan)
-    return result
+def _orthologs(ids, map_dict, one_to_many):
+    # only the looked up lists are measured, not the whole mapping;
+    # genes with too many orthologs count as untranslated
+    orthologs = ids.map(map_dict)
+    return orthologs.mask(orthologs.map(len, na_action="ignore") > one_to_many)
 
 
 def _generate_orthologs(data, column, map_dict, one_to_many):
-    df = data[[column]].drop_duplicates().set_index(column)
-    data[column] = data[column].replace(CPLEX_PREFIX, "", regex=True)
-
-    df["subunits"] = df.index.str.split("_")
-    df["subunits"] = df["subunits"].apply(
-        _replace_subunits,
-        args=(
-            map_dict,
-            one_to_many,
-        ),
+    ids = data[column].drop_duplicates()
+    # strip the prefix once per distinct value, then broadcast back to the rows
+    codes, uniques = pd.factorize(data[column])
+    stripped = pd.Series(uniques).replace(CPLEX_PREFIX, "", regex=True).to_numpy()
+    data[column] = data[column].where(codes < 0, stripped.take(codes))
+
+    # single genes are translated directly, one row per ortholog
+    is_complex = ids.str.contains("_", regex=False, na=False).to_numpy()
+    genes = pd.DataFrame(
+        {
+            column: ids[~is_complex].to_numpy(),
+            "subunits": _orthologs(ids[~is_complex], map_dict, one_to_many),
+        }
     )
-    df = df["subunits"].explode().reset_index()
-
-    grouped = (
-        df.groupby(column).filter(lambda x: x["subunits"].notna().all()).groupby(column)
-    )
-
-    # Generate all possible subunit combinations within each group
-    complexes = []
-    for name, group in grouped:
-        if group["subunits"].isnull().all():
-            continue
-        subunit_lists = [list(x) for x in group["subunits"]]
-        complex_combinations = list(product(*subunit_lists))
-        for complex in complex_combinations:
-            complexes.append((name, "_".join(complex)))
+    genes = genes[genes["subunits"].notna().to_numpy()].explode("subunits")
+
+    # one row per subunit, with the list of its orthologs
+    ids = ids[is_complex]
+    df = pd.DataFrame(
+        {column: ids.to_numpy(), "subunits": ids.str.split("_").to_numpy()}
+    ).explode("subunits", ignore_index=True)
+    df["subunits"] = _orthologs(df["subunits"], map_dict, one_to_many)
+
+    # keep only the complexes with all subunits translated, one row per ortholog
+    df = df[df["subunits"].notna().groupby(df[column]).transform("all")]
+    df["position"] = df.groupby(column).cumcount()
+    df = df.explode("subunits")
+
+    # generate all possible subunit combinations within each complex,
+    # by appending the orthologs of one subunit position at a time
+    complexes = df.loc[df["position"] == 0, [column, "subunits"]]
+    for position in range(1, df["position"].max() + 1 if len(df) else 0):
+        complexes = complexes.merge(
+            df.loc[df["position"] == position, [column, "subunits"]],
+            on=column,
+            how="left",
+            suffixes=("", "_next"),
+        )
+        has_next = complexes["subunits_next"].notna().to_numpy()
+        complexes.loc[has_next, "subunits"] += (
+            "_" + complexes.loc[has_next, "subunits_next"]
+        )
+        complexes = complexes.drop(columns="subunits_next")
+    complexes = pd.concat([genes, complexes]).sort_values(column, kind="stable")
 
     # Create output DataFrame
-    col_names = ["orthology_source", "orthology_target"]
-    result = pd.DataFrame(complexes, columns=col_names).set_index("orthology_source")
+    result = pd.DataFrame(
+        {
+            "orthology_source": complexes[column].to_numpy(dtype=object),
+            "orthology_target": complexes["subunits"].to_numpy(dtype=object),
+        }
+    ).set_index("orthology_source")
 
     return result
 
@@ -108,18 +127,11 @@ def translate_column(
 
     # get orthologs
     source_organism, target_organism = str(source_organism), str(target_organism)
-    map_df = download_homologene(source_organism, target_organism, id_type).set_index(
-        "source"
-    )
-    map_dict = map_df.groupby(level=0)["target"].apply(list).to_dict()
+    map_dict = _get_map_dict(source_organism, target_organism, id_type)
     map_data = _generate_orthologs(data, column, map_dict, one_to_many)
 
     # join orthologs
-    data = (
-        data.set_index(column)
-        .merge(map_data, left_index=True, right_index=True, how="left")
-        .reset_index(names=column)
-    )
+    data = data.set_index(column).join(map_data, how="left").reset_index(names=column)
 
     # replace orthologs
     if replace:
@@ -127,11 +139,8 @@ def translate_column(
         data = data.drop(columns=["orthology_target"])
 
     elif keep_untranslated:
-        data[column] = data.apply(
-            lambda x: x["orthology_target"]
-            if not pd.isnull(x["orthology_target"])
-            else x[column],
-            axis=1,
+        data[column] = data["orthology_target"].where(
+            data["orthology_target"].notna(), data[column]
         )
 
     data = data.dropna(subset=[column])
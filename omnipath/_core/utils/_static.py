@@ -1,5 +1,5 @@
-from typing import List, Union, Literal, Optional
-from functools import partial
+from typing import List, Tuple, Union, Literal, Callable, Optional
+from functools import partial, lru_cache
 import re
 import logging
 import warnings
@@ -11,6 +11,12 @@ import pandas as pd
 from omnipath._core.utils import _options as opt
 from omnipath._core.downloader._downloader import Downloader
 
+_REFILE = re.compile(
+    r'<a href="[^"]+">([^<]+)</a>'
+    r"\s+(\d{2}-\w+-\d{4}) (\d{2}:\d{2})"
+    r"\s+(\d+)[\r\n]*"
+)
+
 
 def static_tables() -> pd.DataFrame:
     """
@@ -20,23 +26,24 @@ def static_tables() -> pd.DataFrame:
     -------
     A data frame with metadata about the static tables.
     """
-    refile = re.compile(
-        r'<a href="[^"]+">([^<]+)</a>'
-        r"\s+(\d{2}-\w+-\d{4}) (\d{2}:\d{2})"
-        r"\s+(\d+)[\r\n]*"
-    )
+    return _static_tables(opt.options.static_url).copy()
 
-    req = requests.get(opt.options.static_url, stream=True)
 
-    result = pd.DataFrame(
-        [
-            refile.match(line.decode("utf-8")).groups()
-            for line in req.raw.readlines()[5:-2]
-        ],
-        columns=["name", "date", "time", "size"],
-    )
+@lru_cache(maxsize=1)
+def _static_tables(static_url: str) -> pd.DataFrame:
+    # the listing is requested once per URL, the result is shared and must not be modified
+    # failed requests raise, they are not cached
+    req = requests.get(static_url, stream=True)
+    req.raise_for_status()
 
-    result["url"] = [f"{opt.options.static_url}/{name}" for name in result.name]
+    lines = req.raw.read().decode("utf-8").splitlines()[5:-2]
+    result = pd.Series(lines, dtype=object).str.extract(_REFILE)
+    result.columns = ["name", "date", "time", "size"]
+
+    if not result["name"].notna().any():
+        raise ValueError(f"No static tables found at `{static_url}`.")
+
+    result["url"] = [f"{static_url}/{name}" for name in result.name]
 
     result = pd.concat(
         [
@@ -54,6 +61,25 @@ def static_tables() -> pd.DataFrame:
     return result
 
 
+@lru_cache(maxsize=None)
+def _request_helpers(query: str) -> Tuple[Optional[type], Optional[Callable]]:
+    # imported lazily, the requests depend on this module being initialized
+    if query == "annotations":
+        from omnipath._core.requests._annotations import Annotations
+
+        return Annotations, None
+
+    if query == "interactions":
+        from omnipath._core.requests.interactions._interactions import (
+            AllInteractions,
+            _to_dataset,
+        )
+
+        return AllInteractions, _to_dataset
+
+    return None, None
+
+
 def static_table(
     query: Literal["annotations", "interactions"],
     resource: str,
@@ -117,18 +143,9 @@ def static_table(
     resources = () if resource_l in ("collectri", "dorothea") else (resource,)
     datasets = () if resources else (resource_l,)
 
-    if query_l == "annotations":
-        from omnipath._core.requests._annotations import Annotations as req_cls
-
-    elif query_l == "interactions":
-        from omnipath._core.requests.interactions._interactions import (
-            AllInteractions as req_cls,
-        )
-        from omnipath._core.requests.interactions._interactions import (
-            InteractionDataset,
-        )
+    req_cls, to_dataset = _request_helpers(query_l)
 
-    s = static_tables()
+    s = _static_tables(opt.options.static_url)
 
     s = s[
         (s["query"] == query_l)
@@ -163,7 +180,8 @@ def static_table(
         "final": {"resources": resources, "datasets": datasets},
     }
     omnipath_req._wide = wide
-    omnipath_req._datasets = {InteractionDataset(d) for d in datasets}
+    if query_l == "interactions":
+        omnipath_req._datasets = frozenset(map(to_dataset, datasets))
     logging.debug("Static table: converting dtypes.")
     result = omnipath_req._convert_dtypes(result)
     logging.debug("Static table: post-pocessing.")
@@ -171,7 +189,8 @@ def static_table(
 
     if resource_l == "dorothea":
         logging.debug("Static table: filtering for DoRothEA confidence levels.")
-        dorothea_levels = set(dorothea_levels)
-        result = result[result.dorothea_level.isin(dorothea_levels)]
+        if dorothea_levels is None:
+            dorothea_levels = ("A", "B", "C")
+        result = result[result.dorothea_level.isin(frozenset(dorothea_levels))]
 
     return result
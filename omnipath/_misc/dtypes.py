@@ -1,4 +1,5 @@
-from typing import Union, Iterable
+from typing import Union, Iterable, Optional
+from functools import partial
 
 import numpy as np
 import pandas as pd
@@ -9,6 +10,7 @@ TRUE = frozenset(("true", "t", "yes", "y"))
 FALSE = frozenset(("false", "f", "no", "n"))
 BOOL = frozenset().union(TRUE, FALSE)
 NA = frozenset(("na", "NA", "NaN", "none", "None", None, pd.NA, pd.NaT, np.nan))
+NA_STR = frozenset(na for na in NA if isinstance(na, str))
 INT = frozenset(
     ("int64", "uint64", "int32", "uint32", "int16", "uint16", "int8", "uint8")
 )
@@ -55,17 +57,17 @@ def _auto_dtype_df(
     categories: bool = True,
     **kwargs,
 ) -> pd.DataFrame:
-    def process_col(col):
+    def process_col(col, values):
         if col in kwargs:
-            return data[col].astype(kwargs[col])
+            return values.astype(kwargs[col])
 
         else:
             return _auto_dtype_series(
-                data[col],
+                values,
                 categories=categories,
             )
 
-    result = {col: process_col(col) for col in data}
+    result = {col: process_col(col, values) for col, values in data.items()}
 
     return pd.DataFrame(result, index=data.index)
 
@@ -75,11 +77,38 @@ def _auto_dtype_series(
     categories: bool = True,
     **kwargs,
 ) -> pd.Series:
-    data = pd.Series(data)
+    if not isinstance(data, pd.Series):
+        data = pd.Series(data)
+    dtype = str(data.dtype)
+
+    if dtype == "bool":
+        return data
+
+    if dtype in INT:
+        # integers can only become bool, no need to cast them to each type
+        return data.astype("bool") if _is_binary(data) else data
+
+    if dtype in FLT:
+        # only whole, finite numbers can be cast to an integer type without loss,
+        # check once instead of probing each integer type with a full copy
+        values = data.to_numpy()
+        if not np.isfinite(values).all() or (values != np.trunc(values)).any():
+            return data
+
+    if dtype == "object":
+        # parse numbers in a single pass, anything else is a string;
+        # the float cast also accepts what `to_numeric` does not, such as "nan"
+        for parse in (pd.to_numeric, partial(pd.Series.astype, dtype="float64")):
+            try:
+                return _auto_dtype_series(parse(data))
+            except (TypeError, ValueError):
+                continue
 
     for t in ALL:
-        if (str(data.dtype) in INT and t in FLT) or (
-            t == "string" and str(data.dtype) != "object"
+        if (
+            (dtype in FLT and t in FLT)
+            or (dtype == "object" and t != "string")
+            or (t == "string" and dtype != "object")
         ):
             continue
 
@@ -87,33 +116,37 @@ def _auto_dtype_series(
             converted = data.astype(t)
 
             if t in FLT:
-                if str(data.dtype) in FLT:
-                    continue
-
-                elif str(data.dtype) not in FLT:
-                    return _auto_dtype_series(converted)
+                return _auto_dtype_series(converted)
 
             if t in INT:
-                if _has_na(converted) or (
-                    str(data.dtype) in FLT and (data != converted).any()
-                ):
+                if _has_na(converted) or (dtype in FLT and (data != converted).any()):
                     continue
 
-                elif sorted(converted.unique()) == [0, 1]:
+                elif _is_binary(converted):
                     t = "bool"
                     converted = converted.astype(t)
 
-                elif str(data.dtype) in INT:
-                    continue
-
             elif t == "string":
-                if not _has_na(converted) and _string_is_bool(converted):
+                # the checks run on the distinct values, mapped back by the codes
+                codes, uniques = pd.factorize(converted)
+                bools = (
+                    None
+                    if (codes < 0).any() or _has_na(uniques)
+                    else _string_to_bool(uniques)
+                )
+                if bools is not None:
                     t = "bool"
-                    converted = _string_to_bool(converted)
-
-                elif converted.nunique() < len(converted) / 4:
-                    t = "category"
-                    converted = converted.astype(t)
+                    converted = pd.Series(
+                        bools.to_numpy()[codes],
+                        index=converted.index,
+                        name=converted.name,
+                    )
+
+                else:
+                    categorical = _string_to_category(converted, codes, uniques)
+                    if categorical is not None:
+                        t = "category"
+                        converted = categorical
 
             return converted
 
@@ -125,27 +158,56 @@ def _auto_dtype_series(
 
 def _has_na(data: Union[pd.Series, Iterable]) -> bool:
     """Chec if any item in the series looks like NA or NaN."""
-    return pd.Series(data).isin(NA).any()
+    data = pd.Series(data)
+    if data.isna().any():
+        return True
 
+    # only strings can spell out NA
+    return (
+        data.dtype == object or isinstance(data.dtype, pd.StringDtype)
+    ) and data.isin(NA_STR).any()
 
-def _string_is_bool(data: Union[pd.Series, Iterable]) -> bool:
-    """
-    Contains only bool-like values
 
-    Tell if a string or object type series contains only values that we
-    recognize as boolean values.
-    """
-    return pd.Series(s.lower() for s in data).isin(BOOL).all()
+def _is_binary(data: pd.Series) -> bool:
+    """Tell if an integer series contains both 0 and 1, and nothing else."""
+    values = data.to_numpy()
+    return len(values) > 0 and values.min() == 0 and values.max() == 1
 
 
-def _string_to_bool(data: Union[pd.Series, Iterable]) -> pd.Series:
+def _string_to_bool(data: Union[pd.Series, Iterable]) -> Optional[pd.Series]:
     """
     Convert to bool if possible
 
     Convert a series or iterable to bool type if all elements can be
-    recognized as a boolean value.
+    recognized as a boolean value, otherwise return `None`. The values
+    are lowercased only once for both the check and the conversion.
     """
-    if _string_is_bool(data):
-        return pd.Series(i.lower() in TRUE for i in data)
+    lower = _lower(data)
+    if lower.isin(BOOL).all():
+        return lower.isin(TRUE)
+
+    return None
+
+
+def _string_to_category(
+    data: pd.Series, codes: np.ndarray, uniques: pd.api.extensions.ExtensionArray
+) -> Optional[pd.Series]:
+    """
+    Convert to category if there are few distinct values
+
+    Convert a series to the `category` type if it has less distinct values
+    than a quarter of its length, otherwise return `None`. ``codes`` and
+    ``uniques`` are the factorized ``data``, reused as the categorical codes.
+    """
+    if len(uniques) >= len(data) / 4:
+        return None
+
+    # same category order as `astype("category")`
+    cat = pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(uniques))
+    cat = cat.reorder_categories(uniques.take(uniques.argsort()))
+
+    return pd.Series(cat, index=data.index, name=data.name)
+
 
-    return pd.Series(data)
+def _lower(data: Union[pd.Series, Iterable]) -> pd.Series:
+    return pd.Series(data, dtype="string").str.lower()
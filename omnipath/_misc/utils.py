@@ -1,4 +1,6 @@
-from typing import Any, Set, Iterable
+from typing import Any, Set, Tuple, Callable, Iterable, Sequence
+from importlib import import_module
+import sys
 
 
 def to_set(value: Any) -> Set:
@@ -22,14 +24,62 @@ def to_set(value: Any) -> Set:
         If `value` is not an iterable and not hashable, or if it's an iterable
         containing non hashable elements.
     """
-    if isinstance(value, Set):
+    # check the common concrete types first, the ABC checks below are much slower
+    if isinstance(value, (set, frozenset)):
         return value
 
     elif value is None:
         return set()
 
-    elif isinstance(value, Iterable) and not isinstance(value, (str, bytes)):
+    elif isinstance(value, (str, bytes)):
+        return {value}
+
+    elif isinstance(value, (list, tuple)):
+        return set(value)
+
+    elif isinstance(value, Set):
+        return value
+
+    elif isinstance(value, Iterable):
         return set(value)
 
     else:
         return {value}
+
+
+def lazy_exports(
+    module: str, source: str, names: Sequence[str]
+) -> Tuple[Callable[[str], Any], Callable[[], Sequence[str]]]:
+    """Create module level `__getattr__` and `__dir__` for lazy exports.
+
+    Parameters
+    ----------
+    module
+        Name of the module exporting the ``names``.
+    source
+        Name of the module defining the ``names``, imported only when one of
+        them is accessed for the first time.
+    names
+        The exported names.
+
+    Returns
+    -------
+    `tuple`
+        The `__getattr__` and `__dir__` functions of ``module``, see :pep:`562`.
+    """
+    names = tuple(names)
+
+    def __getattr__(name: str) -> Any:
+        if name not in names:
+            raise AttributeError(f"module {module!r} has no attribute {name!r}")
+
+        value = getattr(import_module(source), name)
+        # the next lookups find the value without calling this function
+        setattr(sys.modules[module], name, value)
+
+        return value
+
+    def __dir__() -> Sequence[str]:
+        return sorted(names)
+
+    return __getattr__, __dir__
@@ -36,9 +36,7 @@ class ErrorFormatter(ABC):  # noqa: D101
     @classmethod
     def _format(cls, value: Any) -> str:
         """Format the error message for invalid ``value``."""
-        return cls.__error_format__.format(
-            value, cls.__name__, [m.value for m in cls.__members__.values()]
-        )
+        return cls.__error_format__.format(value, cls.__name__, cls.__member_values__)
 
 
 class FormatterMeta(EnumMeta, ABCMeta):  # noqa: D101
@@ -52,6 +50,8 @@ class FormatterMeta(EnumMeta, ABCMeta):  # noqa: D101
 
     def __new__(cls, clsname, superclasses, attributedict):  # noqa: D102
         res = super().__new__(cls, clsname, superclasses, attributedict)
+        # members are fixed once the class is created, list their values only once
+        res.__member_values__ = [m.value for m in res.__members__.values()]
         res.__new__ = _pretty_raise_enum(res, res.__new__)
         return res
 
@@ -98,6 +98,9 @@ class InteractionDataset(PrettyEnumMixin):
     TF_TARGET = "tf_target"
 
 
+_ORGANISM_CODE = {"human": 9606, "rat": 10116, "mouse": 10090}
+
+
 @unique
 class Organism(PrettyEnumMixin):
     """Organism types."""
@@ -108,7 +111,7 @@ class Organism(PrettyEnumMixin):
 
     def __new__(cls, value: str):  # noqa: D102
         obj = object.__new__(cls)
-        obj._code = {"human": 9606, "rat": 10116, "mouse": 10090}[value]
+        obj._code = _ORGANISM_CODE[value]
         return obj
 
     @property
@@ -1 +1,29 @@
-from omnipath._core.requests.interactions import *  # noqa: F401 F403
+from omnipath._misc.utils import lazy_exports
+
+# the request classes are created only when accessed, as creating them
+# might query the server for the valid parameters
+__all__ = [
+    "AllInteractions",
+    "CollecTRI",
+    "Dorothea",
+    "KinaseExtra",
+    "LigRecExtra",
+    "OmniPath",
+    "PathwayExtra",
+    "PostTranslational",
+    "SmallMolecule",
+    "TFmiRNA",
+    "TFtarget",
+    "Transcriptional",
+    "filter_evidences",
+    "from_evidences",
+    "import_intercell_network",
+    "lncRNAmRNA",
+    "miRNA",
+    "only_from",
+    "unnest_evidences",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__, "omnipath._core.requests.interactions", __all__
+)
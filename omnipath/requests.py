@@ -1 +1,14 @@
-from omnipath._core.requests import *  # noqa: F401 F403
+from omnipath._misc.utils import lazy_exports
+
+# the request classes are created only when accessed, as creating them
+# might query the server for the valid parameters
+__all__ = [
+    "Annotations",
+    "Complexes",
+    "Enzsub",
+    "Intercell",
+    "SignedPTMs",
+    "get_many",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, "omnipath._core.requests", __all__)
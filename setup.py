@@ -175,6 +175,7 @@ setup(
     ),
     extras_require={
         "graph": ["networkx>=2.3.0"],
+        "fast": ["orjson>=3.0.0"],
         "tests": ["tox>=3.20.1"],
         "docs": [
             line
@@ -221,6 +221,49 @@ def import_intercell_result() -> pd.DataFrame:
         return pickle.load(fin)
 
 
+@pytest.fixture(scope="function")
+def evidences() -> pd.DataFrame:
+    def ev(dataset: str, resource: str, references=(), via=None) -> dict:
+        return {
+            "dataset": dataset,
+            "resource": resource,
+            "via": via,
+            "references": list(references),
+        }
+
+    signor = ev("omnipath", "SIGNOR", ["12", "3"])
+    kegg = ev("pathwayextra", "KEGG")
+    spike = ev("omnipath", "SPIKE", ["7"], via="SIGNOR")
+    cpdb = ev("ligrecextra", "CellPhoneDB", ["5"])
+
+    return pd.DataFrame(
+        {
+            "source": ["A", "B", "C"],
+            "target": ["B", "A", "D"],
+            "evidences": [
+                {
+                    "positive": [signor],
+                    "negative": [],
+                    "directed": [signor, kegg],
+                    "undirected": [],
+                },
+                {
+                    "positive": [],
+                    "negative": [spike],
+                    "directed": [spike],
+                    "undirected": [],
+                },
+                {
+                    "positive": [],
+                    "negative": [],
+                    "directed": [],
+                    "undirected": [cpdb],
+                },
+            ],
+        }
+    )
+
+
 @pytest.fixture(scope="session")
 def string_series() -> pd.Series:
     return pd.Series(["foo:123", "bar:45;baz", None, "baz:67;bar:67", "foo;foo;foo"])
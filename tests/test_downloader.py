@@ -220,3 +220,17 @@ class TestDownloader:
 
         assert requests_mock.called_once
         assert version == "42.1337.00"
+
+    def test_get_server_version_cached(self, options: Options, requests_mock):
+        url = urljoin(options.url, Endpoint.ABOUT.s)
+        options.autoload = True
+        requests_mock.register_uri(
+            "GET",
+            f"{url}?format=text",
+            content=bytes("version: 42.1337.00", encoding="utf-8"),
+        )
+
+        assert _get_server_version(options) == "42.1337.00"
+        assert _get_server_version(options) == "42.1337.00"
+        assert requests_mock.call_count == 1
+        assert len(options.cache) == 1
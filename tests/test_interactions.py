@@ -11,7 +11,21 @@ from omnipath import options
 from omnipath.constants import Organism, InteractionDataset
 from omnipath._core.requests import Intercell
 from omnipath.constants._pkg_constants import Key, Endpoint
-from omnipath._core.requests.interactions._utils import import_intercell_network
+from omnipath._core.requests.interactions._utils import (
+    _not_intracell,
+    _swap_undirected,
+    _aggregate_intercell,
+    import_intercell_network,
+)
+from omnipath._core.requests.interactions._evidences import (
+    only_from,
+    from_evidences,
+    _resources_from,
+    _references_from,
+    filter_evidences,
+    unnest_evidences,
+    _curation_effort_from,
+)
 from omnipath._core.requests.interactions._interactions import (
     TFmiRNA,
     Dorothea,
@@ -44,6 +58,18 @@ class TestInteractions:
         ):
             AllInteractions.get(exclude="foo")
 
+    def test_invalid_datasets_type(self):
+        with pytest.raises(TypeError, match=r"Expected `exclude` to be an `Iterable`"):
+            AllInteractions.get(exclude=42)
+
+    def test_datasets_generator(self):
+        req = AllInteractions(include=(d for d in ("omnipath", "dorothea")))
+
+        assert req._datasets == {
+            InteractionDataset.OMNIPATH,
+            InteractionDataset.DOROTHEA,
+        }
+
     def test_graph_empty(self):
         with pytest.raises(ValueError, match=r"No data were retrieved. Please"):
             AllInteractions.graph(pd.DataFrame())
@@ -73,6 +99,26 @@ class TestInteractions:
         assert src == "source"
         assert tgt == "target"
 
+    def test_graph_split_attributes(self):
+        interaction = pd.DataFrame(
+            {
+                "source": ["alpha", "beta", "gamma"],
+                "target": ["beta", "gamma", "alpha"],
+                "sources": ["foo;bar", "baz", None],
+                "references": ["foo:2;foo:1", None, "bar:3"],
+                "curation_effort": [2, 1, 1],
+            }
+        )
+        G = AllInteractions.graph(interaction)
+
+        assert G.number_of_edges() == 3
+        assert G.edges["alpha", "beta"]["sources"] == ["bar", "foo"]
+        assert G.edges["alpha", "beta"]["references"] == ["foo:1", "foo:2"]
+        assert G.edges["beta", "gamma"]["sources"] == "baz"
+        assert G.edges["gamma", "alpha"]["references"] == "bar:3"
+        assert G.edges["gamma", "alpha"]["curation_effort"] == 1
+        assert interaction["sources"].iloc[0] == "foo;bar"
+
     @pytest.mark.parametrize(
         "interaction",
         [
@@ -269,6 +315,119 @@ class TestUtils:
             import_intercell_result.values[~pd.isnull(import_intercell_result)],
         )
         assert len(requests_mock.request_history) == 3
+        for col in ("category", "parent"):
+            for suffix in ("_intercell_source", "_intercell_target"):
+                assert isinstance(res[f"{col}{suffix}"].dtype, pd.CategoricalDtype)
+
+        cached = import_intercell_network(
+            include=[InteractionDataset.OMNIPATH],
+            transmitter_params={"categories": "ligand"},
+            interactions_params={"dorothea_levels": "A"},
+            receiver_params={"categories": "receptor"},
+        )
+
+        pd.testing.assert_frame_equal(cached, res)
+        assert len(requests_mock.request_history) == 3
+
+        license = options.license
+        try:
+            options.license = "commercial"
+            _ = import_intercell_network(
+                include=[InteractionDataset.OMNIPATH],
+                transmitter_params={"categories": "ligand"},
+                interactions_params={"dorothea_levels": "A"},
+                receiver_params={"categories": "receptor"},
+            )
+        finally:
+            options.license = license
+
+        assert len(requests_mock.request_history) == 6
+        assert "license=commercial" in requests_mock.request_history[-1].url
+
+    def test_import_intercell_network_shared_query(
+        self,
+        cache_backup,
+        requests_mock,
+        interactions_data: bytes,
+        transmitters_data: bytes,
+        receivers_data: bytes,
+        import_intercell_result: pd.DataFrame,
+    ):
+        interactions_url = urljoin(options.url, AllInteractions._query_type.endpoint)
+        intercell_url = urljoin(options.url, Intercell._query_type.endpoint)
+        # both sides in one response, without the receivers' header
+        intercell_data = transmitters_data + receivers_data.split(b"\n", 1)[1]
+
+        requests_mock.register_uri(
+            "GET",
+            f"{interactions_url}?datasets=omnipath&dorothea_levels=A&fields=curation_effort%2C"
+            f"references%2Csources%2Ctype&format=tsv",
+            content=interactions_data,
+        )
+        requests_mock.register_uri(
+            "GET",
+            f"{intercell_url}?format=tsv&scope=generic",
+            content=intercell_data,
+        )
+
+        res = import_intercell_network(
+            include=InteractionDataset.OMNIPATH,
+            interactions_params={"dorothea_levels": "A"},
+        )
+
+        np.testing.assert_array_equal(res.shape, import_intercell_result.shape)
+        np.testing.assert_array_equal(
+            pd.isnull(res), pd.isnull(import_intercell_result)
+        )
+        np.testing.assert_array_equal(
+            res.values[~pd.isnull(res)],
+            import_intercell_result.values[~pd.isnull(import_intercell_result)],
+        )
+        assert len(requests_mock.request_history) == 2
+
+    def test_swap_undirected(self):
+        df = pd.DataFrame(
+            {
+                "source": ["a", "c"],
+                "target": ["b", "d"],
+                "source_genesymbol": ["A", "C"],
+                "target_genesymbol": ["B", "D"],
+                "is_directed": [True, False],
+                "curation_effort": [1, 2],
+            }
+        )
+        res = _swap_undirected(df)
+
+        assert "is_directed" in df
+        assert "is_directed" not in res
+        assert res["source"].tolist() == ["a", "c", "d"]
+        assert res["target"].tolist() == ["b", "d", "c"]
+        assert res["source_genesymbol"].tolist() == ["A", "C", "D"]
+        assert res["target_genesymbol"].tolist() == ["B", "D", "C"]
+        assert res["curation_effort"].tolist() == [1, 2, 2]
+
+    @pytest.mark.parametrize("dtype", [object, "category"])
+    def test_not_intracell(self, dtype):
+        df = pd.DataFrame(
+            {"parent": ["ligand", "intracellular", None, "receptor"]}, dtype=dtype
+        )
+
+        np.testing.assert_array_equal(_not_intracell(df), [True, False, True, True])
+
+    def test_aggregate_intercell_missing_database(self):
+        df = pd.DataFrame(
+            {
+                "uniprot": ["P1", "P1", "P2"],
+                "category": pd.Categorical(["ligand", "ligand", "receptor"]),
+                "parent": pd.Categorical(["ligand", "ligand", "receptor"]),
+                "database": ["CellPhoneDB", np.nan, np.nan],
+            }
+        )
+
+        res = _aggregate_intercell(df)
+
+        assert res["uniprot"].tolist() == ["P1", "P2"]
+        assert res["database"].tolist() == ["CellPhoneDB", ""]
 
     @pytest.mark.parametrize("which", ["interactions", "receivers", "transmitters"])
     def test_intercell_empty(
@@ -323,3 +482,129 @@ class TestUtils:
                 interactions_params={"resources": "CellPhoneDB"},
                 receiver_params={"categories": "receptor"},
             )
+
+
+class TestEvidences:
+    def test_unnest_evidences(self, evidences: pd.DataFrame):
+        nested = evidences["evidences"].tolist()
+        res = unnest_evidences(evidences)
+
+        for key in ("positive", "negative", "directed", "undirected"):
+            assert res[key].tolist() == [evs[key] for evs in nested]
+
+    def test_filter_evidences(self, evidences: pd.DataFrame):
+        res = filter_evidences(evidences, datasets="omnipath", target_col="filtered")
+
+        assert [len(evs["directed"]) for evs in res["filtered"]] == [1, 1, 0]
+        assert [len(evs["undirected"]) for evs in res["filtered"]] == [0, 0, 0]
+        assert [len(evs["directed"]) for evs in res["evidences"]] == [2, 1, 0]
+
+    def test_filter_evidences_resources(self, evidences: pd.DataFrame):
+        res = filter_evidences(evidences, resources=["KEGG", "CellPhoneDB"])
+
+        assert [ev["resource"] for ev in res["evidences"][0]["directed"]] == ["KEGG"]
+        assert res["evidences"][0]["positive"] == []
+        assert len(res["evidences"][2]["undirected"]) == 1
+
+    def test_filter_evidences_no_filter(self, evidences: pd.DataFrame):
+        res = filter_evidences(evidences, target_col="filtered")
+
+        assert res["filtered"].tolist() == res["evidences"].tolist()
+
+    def test_filter_evidences_missing(self, evidences: pd.DataFrame):
+        evidences.loc[1, "evidences"] = None
+        res = filter_evidences(evidences, datasets="ligrecextra")
+
+        assert res["evidences"][1] is None
+        assert res["evidences"][0]["directed"] == []
+        assert len(res["evidences"][2]["undirected"]) == 1
+
+    def test_from_evidences(self, evidences: pd.DataFrame):
+        res = from_evidences(evidences)
+
+        assert res["sources"].tolist() == ["KEGG;SIGNOR", "SPIKE_SIGNOR", "CellPhoneDB"]
+        assert res["references"].tolist() == [
+            "SIGNOR:12;SIGNOR:3",
+            "SPIKE:7",
+            "CellPhoneDB:5",
+        ]
+        assert res["curation_effort"].tolist() == [7, 4, 2]
+        assert res["is_directed"].tolist() == [True, True, False]
+        assert res["is_stimulation"].tolist() == [True, False, False]
+        assert res["is_inhibition"].tolist() == [False, True, False]
+        assert res["consensus_stimulation"].tolist() == [True, False, True]
+        assert res["consensus_inhibition"].tolist() == [False, True, True]
+        assert res["consensus_direction"].tolist() == [True, False, True]
+        assert res["n_sources"].tolist() == [2, 1, 1]
+        assert res["n_primary_sources"].tolist() == [2, 0, 1]
+        assert res["n_references"].tolist() == [2, 1, 1]
+        for col in (
+            "is_directed",
+            "is_stimulation",
+            "is_inhibition",
+            "consensus_direction",
+            "consensus_stimulation",
+            "consensus_inhibition",
+        ):
+            assert res[col].dtype == bool
+        assert res["curation_effort"].dtype == np.int64
+
+    def test_from_evidences_duplicated_pairs(self, evidences: pd.DataFrame):
+        df = pd.concat([evidences, evidences.iloc[[0]]], ignore_index=True)
+        res = from_evidences(df)
+
+        assert res["source"].tolist() == ["A", "B", "C", "A"]
+        assert res["curation_effort"].tolist() == [7, 4, 2, 7]
+
+    def test_from_evidences_index(self, evidences: pd.DataFrame):
+        res = from_evidences(evidences.set_axis([10, 11, 12]))
+
+        assert res.index.tolist() == [10, 11, 12]
+        assert res["n_references"].tolist() == [2, 1, 1]
+        assert res["references_stripped"].tolist() == ["12;3", "7", "5"]
+
+    def test_curation_effort_from(self, evidences: pd.DataFrame):
+        assert _curation_effort_from(evidences, "evidences") == [7, 4, 2]
+
+        evidences = unnest_evidences(evidences)
+        assert _curation_effort_from(evidences, "positive") == [3, 0, 0]
+        assert _curation_effort_from(evidences, ["positive", "directed"]) == [7, 2, 0]
+
+    def test_resources_references_from(self, evidences: pd.DataFrame):
+        evidences = unnest_evidences(evidences)
+
+        assert _resources_from(evidences, "directed") == [
+            "KEGG;SIGNOR",
+            "SPIKE_SIGNOR",
+            "",
+        ]
+        assert _references_from(evidences) == [
+            "SIGNOR:12;SIGNOR:3",
+            "SPIKE:7",
+            "CellPhoneDB:5",
+        ]
+        assert _references_from(evidences, "negative", prefix=False) == ["", "7", ""]
+
+    def test_only_from(self, evidences: pd.DataFrame):
+        res = only_from(evidences, datasets="omnipath")
+
+        assert "evidences_filtered_tmp" not in res
+        assert res["source"].tolist() == ["A", "B"]
+        assert res["sources"].tolist() == ["SIGNOR", "SPIKE_SIGNOR"]
+        assert res["curation_effort"].tolist() == [6, 4]
+        assert res["evidences"].tolist() == evidences["evidences"].tolist()[:2]
+
+    def test_only_from_drops_middle_record(self, evidences: pd.DataFrame):
+        evidences = evidences.iloc[[0, 2, 1]].reset_index(drop=True)
+        res = only_from(evidences, datasets="omnipath")
+
+        assert res.index.tolist() == [0, 2]
+        assert res["source"].tolist() == ["A", "B"]
+        assert res["n_references"].tolist() == [2, 1]
+        assert res["n_sources"].tolist() == [1, 1]
+
+    def test_only_from_no_match(self, evidences: pd.DataFrame):
+        res = only_from(evidences, resources="foo")
+
+        assert res.empty
+        assert "curation_effort" in res
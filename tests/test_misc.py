@@ -1,3 +1,5 @@
+import pytest
+
 from pandas.testing import assert_frame_equal
 import pandas as pd
 
@@ -45,3 +47,52 @@ class TestMisc:
         out = dtypes.auto_dtype(inp)
 
         assert_frame_equal(exp, out)
+
+    def test_auto_dtype_object_numbers(self):
+        inp = pd.DataFrame(
+            {
+                "a": ["1", None, "3"],
+                "b": [1.7, "2", "3"],
+                "c": ["1", "nan", "3"],
+                "d": ["1", "NA", "3"],
+            },
+            dtype=object,
+        )
+
+        out = dtypes.auto_dtype(inp)
+
+        assert_frame_equal(
+            out[["a", "b", "c"]],
+            pd.DataFrame(
+                {
+                    "a": [1.0, None, 3.0],
+                    "b": [1.7, 2.0, 3.0],
+                    "c": [1.0, None, 3.0],
+                }
+            ),
+        )
+        assert out["d"].dtype == "string"
+
+    def test_has_na(self):
+        assert dtypes._has_na(pd.Series([1.0, None]))
+        assert dtypes._has_na(pd.Series(["a", "None"], dtype=object))
+        assert dtypes._has_na(pd.Series(["a", "NA"], dtype="string"))
+        assert not dtypes._has_na(pd.Series(["a", "nan value"], dtype=object))
+        assert not dtypes._has_na(pd.Series([1, 2]))
+
+    def test_auto_dtype_bool(self):
+        for values in ([True, False], [True, True]):
+            out = dtypes.auto_dtype(pd.Series(values))
+
+            assert out.dtype == "bool"
+            assert out.tolist() == values
+
+    def test_lazy_exports(self):
+        from omnipath._core.requests import Enzsub
+        import omnipath as op
+
+        assert dir(op.requests) == sorted(op.requests.__all__)
+        assert op.requests.Enzsub is Enzsub
+        assert "Enzsub" in vars(op.requests)
+        with pytest.raises(AttributeError, match="no attribute 'foo'"):
+            _ = op.requests.foo
@@ -1,6 +1,6 @@
 import pandas as pd
 
-from omnipath._core.utils._orthology import translate_column
+from omnipath._core.utils._orthology import translate_column, _generate_orthologs
 from omnipath._core.utils._homologene import download_homologene
 
 
@@ -74,3 +74,18 @@ class TestOrthologyConversion:
         untranslated = keep_missing["symbol"].isin(["HCST_KLRK1"])
         assert untranslated.any()
         assert keep_missing[untranslated]["orthology_target"].isna().all()
+
+    def test_generate_orthologs(self):
+        data = pd.DataFrame({"symbol": ["A_B", "C", "A_D", "A_B_C"]})
+        map_dict = {"A": ["a"], "B": ["b1", "b2"], "C": ["c"]}
+
+        res = _generate_orthologs(data, "symbol", map_dict, one_to_many=2)
+
+        assert res.index.tolist() == ["A_B", "A_B", "A_B_C", "A_B_C", "C"]
+        assert res["orthology_target"].tolist() == [
+            "a_b1",
+            "a_b2",
+            "a_b1_c",
+            "a_b2_c",
+            "c",
+        ]
@@ -28,6 +28,18 @@ class TestUtils:
         with pytest.raises(TypeError):
             _get_synonyms(42)
 
+    def test_predefined_synonyms(self):
+        from inflect import engine
+
+        from omnipath._core.query._query import _SYNONYMS
+
+        eng = engine()
+        for key, synonyms in _SYNONYMS.items():
+            singular = eng.singular_noun(key)
+            singular = singular if isinstance(singular, str) else key
+
+            assert synonyms == tuple(sorted({singular, eng.plural_noun(singular)}))
+
     def test_get_synonyms_from_s2p(self):
         res = _get_synonyms("cat")
 
@@ -5,13 +5,14 @@ import json
 import logging
 
 import pytest
+import requests
 
 from pandas.api.types import is_object_dtype
 import numpy as np
 import pandas as pd
 
-from omnipath import options
-from omnipath.requests import Enzsub, Complexes, Intercell, Annotations
+from omnipath import static, options, clear_cache
+from omnipath.requests import Enzsub, Complexes, Intercell, Annotations, get_many
 from omnipath._core.requests import SignedPTMs
 from omnipath._core.query._query import EnzsubQuery
 from omnipath._core.requests._utils import _split_unique_join, _strip_resource_label
@@ -79,6 +80,17 @@ class TestEnzsub:
         np.testing.assert_array_equal(res.values, df.values)
         assert requests_mock.called_once
 
+    def test_server_error(self, cache_backup, requests_mock):
+        url = urljoin(options.url, Enzsub._query_type.endpoint)
+        requests_mock.register_uri(
+            "GET",
+            f"{url}?fields=curation_effort%2Creferences%2Csources&format=tsv",
+            content=b"Something is not entirely good:\nUnknown argument: foo\n",
+        )
+
+        with pytest.raises(RuntimeError, match=r"^Unknown argument: foo$"):
+            Enzsub.get()
+
     def test_annotations(self):
         assert set(Enzsub._annotations().keys()) == {e.param for e in EnzsubQuery}
         assert all(
@@ -534,6 +546,78 @@ class TestSignedPTMs:
             assert attr["references"] == ["bar", "baz"]
 
 
+class TestGetMany:
+    def test_invalid_max_workers(self):
+        with pytest.raises(ValueError, match=r"Expected `max_workers` to be positive"):
+            get_many([Enzsub], max_workers=0)
+
+    def test_get_many(self, cache_backup, requests_mock, tsv_data: bytes):
+        enzsub_url = urljoin(options.url, Enzsub._query_type.endpoint)
+        annot_url = urljoin(options.url, Annotations._query_type.endpoint)
+        requests_mock.register_uri(
+            "GET",
+            f"{enzsub_url}?fields=curation_effort%2Creferences%2Csources&format=tsv",
+            content=tsv_data,
+        )
+        requests_mock.register_uri(
+            "GET", f"{annot_url}?proteins=bar&format=tsv", content=tsv_data
+        )
+        df = pd.read_csv(StringIO(tsv_data.decode("utf-8")), sep="\t")
+
+        res = get_many([Enzsub, (Annotations, {"proteins": ["bar"]})])
+
+        assert len(res) == 2
+        for r in res:
+            np.testing.assert_array_equal(r.columns, df.columns)
+            np.testing.assert_array_equal(r.values, df.values)
+        assert len(requests_mock.request_history) == 2
+
+
+class TestStaticTables:
+    def test_server_error_not_cached(self, requests_mock):
+        url = "http://localhost/static"
+        listing = (
+            "\n" * 5
+            + '<a href="interactions_omnipath_9606.tsv.gz">'
+            + "interactions_omnipath_9606.tsv.gz</a>  01-Jan-2023 12:00  1024\n"
+            + "\n" * 2
+        )
+        requests_mock.register_uri(
+            "GET",
+            url,
+            [
+                {"status_code": 503, "content": b"Service Unavailable"},
+                {"status_code": 200, "content": b"Not a listing"},
+                {"status_code": 200, "content": listing.encode()},
+            ],
+        )
+
+        old_url = options.static_url
+        try:
+            options.static_url = url
+            clear_cache()
+
+            with pytest.raises(requests.HTTPError):
+                static.static_tables()
+            with pytest.raises(ValueError, match=r"No static tables found"):
+                static.static_tables()
+
+            res = static.static_tables()
+            assert res.shape == (1, 8)
+            assert res["name"].tolist() == ["interactions_omnipath_9606.tsv.gz"]
+            assert res["organism"].tolist() == ["9606"]
+
+            static.static_tables()
+            assert len(requests_mock.request_history) == 3
+
+            clear_cache()
+            static.static_tables()
+            assert len(requests_mock.request_history) == 4
+        finally:
+            options.static_url = old_url
+            clear_cache()
+
+
 class TestUtils:
     def test_split_unique_join_no_func(self, string_series: pd.Series):
         res = _split_unique_join(string_series)